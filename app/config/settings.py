@@ -14,20 +14,78 @@ class Settings:
     Attributes:
         GENAI_API_KEY (str): Clave de API para Google Gemini AI
         SESSION_SECRET_KEY (str): Clave secreta para firmar cookies de sesión
-        CACHE_SIZE (int): Tamaño máximo del cache de preguntas
-        CACHE_MIN (int): Número mínimo de preguntas en cache antes de recargar
+        ADMIN_TOKEN (str): Token de la API de administración (sin configurar, la API queda deshabilitada)
+        CACHE_MAX_BYTES (int): Presupuesto de memoria en bytes del cache de preguntas de cada categoría
+        CACHE_HOT_ENTRIES (int): Preguntas próximas a servirse que se guardan sin comprimir
+        QUESTION_MAX_USES (int): Veces que se sirve cada pregunta antes de retirarla (1 desactiva la reutilización)
+        SEEN_FILTER_BITS (int): Tamaño en bits del filtro de preguntas vistas de cada sesión
+        SEEN_FILTER_HASHES (int): Posiciones del filtro marcadas por cada pregunta
+        CACHE_MIN (int): Número mínimo de preguntas en cache (por categoría) antes de recargar
         TOTAL_QUESTIONS (int): Total de preguntas por quiz
         SESSION_COOKIE (str): Nombre de la cookie de sesión
         SESSION_MAX_AGE (int): Tiempo de vida de la sesión en segundos
         TEMPLATES_DIR (str): Directorio donde se encuentran las plantillas HTML
         MAX_PREVIOUS_TOPICS (int): Máximo de temáticas previas a considerar para evitar repeticiones
+        API_MAX_ACTIVE_QUIZZES (int): Máximo de quizzes de la API JSON pendientes de corrección
+        WS_WAIT_INTERVAL (int): Segundos entre avisos de progreso mientras el WebSocket espera una pregunta
+        WS_MAX_WAITS (int): Avisos de espera antes de generar la pregunta directamente
+        CATEGORY_MIN_SHARE (float): Fracción mínima de la cuota de generación garantizada a cada categoría
+        DEMAND_HALF_LIFE (int): Vida media en segundos de la demanda reciente usada para repartir la cuota
+        GENERATOR_WORKERS (int): Hilos de precarga que generan preguntas en paralelo
+        GENERATION_INTERVAL (float): Pausa en segundos de cada hilo tras generar una pregunta
+        GENERATION_IDLE_INTERVAL (float): Pausa en segundos de cada hilo cuando ningún cache necesita preguntas
+        GENERATION_ERROR_INTERVAL (float): Pausa en segundos tras un error de generación
+        RATE_LIMIT_BACKOFF (float): Pausa en segundos tras alcanzar el límite de la API (RESOURCE_EXHAUSTED)
+        QUESTION_STORE_SIZE (int): Máximo de preguntas servidas que se conservan para la revisión de resultados
+        ANSWER_LOG_SESSIONS (int): Máximo de sesiones con registro de respuestas en memoria
+        STATS_FILE (str): Archivo donde se persisten las estadísticas de respuestas
+        STATS_FLUSH_EVERY (int): Respuestas registradas entre cada persistencia de las estadísticas
+        STATS_MAX_QUESTIONS (int): Máximo de preguntas con estadísticas en memoria
+        STATS_RETIRE_MIN_ATTEMPTS (int): Intentos mínimos antes de evaluar el retiro de una pregunta
+        STATS_RETIRE_WRONG_SHARE (float): Fracción de respuestas en una misma opción incorrecta que retira la pregunta
+        GEMINI_TIMEOUT (int): Timeout HTTP en segundos de cada llamada a Gemini
+        REQUEST_DEADLINE (int): Plazo máximo en segundos para obtener una pregunta durante un request
+        DISCONNECT_POLL_INTERVAL (float): Segundos entre verificaciones de desconexión del cliente
+        PREVIEW_TTL (int): Segundos durante los que se comparte la misma pregunta de vista previa
+        SESSION_BUCKET_CAPACITY (int): Quizzes que un cliente puede iniciar seguidos
+        SESSION_BUCKET_REFILL (float): Quizzes por segundo que recupera cada cliente
+        RATE_LIMIT_CLIENTS (int): Máximo de clientes con límite de frecuencia en memoria
     """
     GENAI_API_KEY: str = os.getenv("GENAI_API_KEY")
     SESSION_SECRET_KEY: str = os.getenv("SESSION_SECRET_KEY")
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN")
     
     # Configuración del cache de preguntas
-    CACHE_SIZE: int = 200  # Máximo de preguntas en cache
-    CACHE_MIN: int = 100   # Mínimo antes de recargar
+    CACHE_MAX_BYTES: int = 1024 * 1024  # Memoria máxima del cache (1 MB por categoría)
+    CACHE_HOT_ENTRIES: int = 20  # Preguntas sin comprimir (por categoría)
+    CACHE_MIN: int = 100   # Mínimo antes de recargar (por categoría)
+
+    # Configuración de reutilización de preguntas
+    QUESTION_MAX_USES: int = 30   # Usos por pregunta antes de retirarla (1 = sin reutilización)
+    SEEN_FILTER_BITS: int = 256   # Bits del filtro de preguntas vistas por sesión
+    SEEN_FILTER_HASHES: int = 3   # Posiciones marcadas por pregunta
+
+    # Configuración del registro de respuestas
+    QUESTION_STORE_SIZE: int = 20000  # Preguntas servidas que se conservan para la revisión
+    ANSWER_LOG_SESSIONS: int = 5000   # Sesiones con registro de respuestas en memoria
+
+    # Configuración de estadísticas de respuestas
+    STATS_FILE: str = os.getenv("STATS_FILE", "estadisticas_preguntas.json")
+    STATS_FLUSH_EVERY: int = 50            # Respuestas entre cada persistencia
+    STATS_MAX_QUESTIONS: int = 20000       # Preguntas con estadísticas en memoria
+    STATS_RETIRE_MIN_ATTEMPTS: int = 20    # Intentos antes de evaluar el retiro
+    STATS_RETIRE_WRONG_SHARE: float = 0.8  # Fracción en una misma opción incorrecta que retira la pregunta
+
+    # Configuración de plazos y timeouts
+    GEMINI_TIMEOUT: int = 20                # Timeout HTTP de cada llamada a Gemini
+    REQUEST_DEADLINE: int = 30              # Plazo para obtener una pregunta en un request
+    DISCONNECT_POLL_INTERVAL: float = 0.5   # Intervalo de verificación de desconexión
+
+    # Configuración de protección del inicio de sesiones
+    PREVIEW_TTL: int = 60                   # Vigencia de la pregunta de vista previa
+    SESSION_BUCKET_CAPACITY: int = 300      # Quizzes iniciados seguidos por cliente (un aula entera detrás de una IP)
+    SESSION_BUCKET_REFILL: float = 1        # Un quiz nuevo por segundo por cliente
+    RATE_LIMIT_CLIENTS: int = 10000         # Clientes con límite en memoria
     
     # Configuración del quiz
     TOTAL_QUESTIONS: int = 10  # Total de preguntas por sesión
@@ -41,6 +99,24 @@ class Settings:
 
     # Configuración de temáticas previas para evitar repeticiones
     MAX_PREVIOUS_TOPICS: int = 8  # Máximo de temáticas previas a considerar
+
+    # Configuración de la API JSON
+    API_MAX_ACTIVE_QUIZZES: int = 5000  # Quizzes entregados pendientes de corrección
+
+    # Configuración del canal WebSocket
+    WS_WAIT_INTERVAL: int = 2  # Segundos entre avisos de espera
+    WS_MAX_WAITS: int = 10     # Avisos de espera antes de generar directamente
+
+    # Configuración del reparto de generación entre categorías
+    CATEGORY_MIN_SHARE: float = 0.1  # Fracción mínima de la cuota por categoría
+    DEMAND_HALF_LIFE: int = 60 * 10  # Vida media de la demanda reciente (10 minutos)
+
+    # Configuración de los hilos de precarga
+    GENERATOR_WORKERS: int = 1              # Hilos que generan en paralelo
+    GENERATION_INTERVAL: float = 5          # Pausa tras cada pregunta generada
+    GENERATION_IDLE_INTERVAL: float = 2     # Pausa cuando ningún cache necesita preguntas
+    GENERATION_ERROR_INTERVAL: float = 5    # Pausa tras un error de generación
+    RATE_LIMIT_BACKOFF: float = 35          # Pausa tras alcanzar el límite de la API
     
     def __init__(self):
         """
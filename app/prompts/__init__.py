@@ -1,3 +1,22 @@
 from .gemini_prompt import GEMINI_SYSTEM_PROMPT, build_prompt_with_previous_topics
+from .registry import (
+    DEFAULT_CATEGORY,
+    PROMPT_REGISTRY,
+    CATEGORIES,
+    resolve_category,
+    get_system_prompt,
+    get_difficulty_instructions,
+    list_categories
+)
 
-__all__ = ["GEMINI_SYSTEM_PROMPT", "build_prompt_with_previous_topics"]
+__all__ = [
+    "GEMINI_SYSTEM_PROMPT",
+    "build_prompt_with_previous_topics",
+    "DEFAULT_CATEGORY",
+    "PROMPT_REGISTRY",
+    "CATEGORIES",
+    "resolve_category",
+    "get_system_prompt",
+    "get_difficulty_instructions",
+    "list_categories"
+]
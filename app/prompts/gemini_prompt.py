@@ -104,12 +104,21 @@ Devuelve únicamente un objeto JSON con esta estructura exacta:
 - Generar preguntas que tengan temas repetidos de 'tematicas_previas'.
 """
 
-def build_prompt_with_previous_topics(previous_topics: list = None) -> str:
+DIFFICULTY_INSTRUCTIONS = {
+    "basica": "código corto (3 o 4 líneas) con una o dos operaciones simples",
+    "intermedia": "código de 5 o 6 líneas que combine varias operaciones",
+    "avanzada": "código de 7 u 8 líneas con operaciones encadenadas y conversiones de tipo"
+}
+
+def build_prompt_with_previous_topics(previous_topics: list = None, difficulty: str = None, system_prompt: str = None, difficulty_instructions: dict = None) -> str:
     """
     Build the complete prompt including previous topics to avoid repetition
     
     Args:
         previous_topics: List of previously used topics
+        difficulty: Optional target difficulty (key of difficulty_instructions)
+        system_prompt: Category system prompt (defaults to GEMINI_SYSTEM_PROMPT)
+        difficulty_instructions: Category difficulty texts (defaults to DIFFICULTY_INSTRUCTIONS)
         
     Returns:
         Complete prompt string with previous topics context
@@ -117,8 +126,19 @@ def build_prompt_with_previous_topics(previous_topics: list = None) -> str:
     if previous_topics is None:
         previous_topics = []
 
+    if system_prompt is None:
+        system_prompt = GEMINI_SYSTEM_PROMPT
+
+    if difficulty_instructions is None:
+        difficulty_instructions = DIFFICULTY_INSTRUCTIONS
+
     import json
     topics_json = json.dumps(previous_topics, ensure_ascii=False)
     avoid_instruction = "## Importante: Evita SI O SI usar cualquiera de las temáticas listadas en 'tematicas_previas' para generar esta nueva pregunta."
     
-    return f"{GEMINI_SYSTEM_PROMPT}\n\n## tematicas_previas = {topics_json}\n\n{avoid_instruction}\n"
+    prompt = f"{system_prompt}\n\n## tematicas_previas = {topics_json}\n\n{avoid_instruction}\n"
+
+    if difficulty in difficulty_instructions:
+        prompt += f"\n## Dificultad: genera un ejercicio con {difficulty_instructions[difficulty]}.\n"
+
+    return prompt
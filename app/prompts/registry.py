@@ -0,0 +1,98 @@
+from .gemini_prompt import GEMINI_SYSTEM_PROMPT, DIFFICULTY_INSTRUCTIONS
+from .category_prompts import (
+    CONDICIONALES_SYSTEM_PROMPT,
+    CONDICIONALES_DIFFICULTY_INSTRUCTIONS,
+    REPETITIVAS_SYSTEM_PROMPT,
+    REPETITIVAS_DIFFICULTY_INSTRUCTIONS,
+    CADENAS_SYSTEM_PROMPT,
+    CADENAS_DIFFICULTY_INSTRUCTIONS
+)
+
+DEFAULT_CATEGORY = "secuenciales"
+
+PROMPT_REGISTRY = {
+    "secuenciales": {
+        "nombre": "Secuenciales",
+        "descripcion": "Asignaciones, operaciones y conversiones de tipo, sin condicionales ni bucles.",
+        "prompt": GEMINI_SYSTEM_PROMPT,
+        "dificultades": DIFFICULTY_INSTRUCTIONS
+    },
+    "condicionales": {
+        "nombre": "Condicionales",
+        "descripcion": "Estructuras if, elif y else, operadores lógicos y condiciones anidadas.",
+        "prompt": CONDICIONALES_SYSTEM_PROMPT,
+        "dificultades": CONDICIONALES_DIFFICULTY_INSTRUCTIONS
+    },
+    "repetitivas": {
+        "nombre": "Repetitivas",
+        "descripcion": "Bucles for y while, acumuladores y contadores.",
+        "prompt": REPETITIVAS_SYSTEM_PROMPT,
+        "dificultades": REPETITIVAS_DIFFICULTY_INSTRUCTIONS
+    },
+    "cadenas": {
+        "nombre": "Cadenas",
+        "descripcion": "Indexación, slicing, métodos de str y formateo de texto.",
+        "prompt": CADENAS_SYSTEM_PROMPT,
+        "dificultades": CADENAS_DIFFICULTY_INSTRUCTIONS
+    }
+}
+
+CATEGORIES = tuple(PROMPT_REGISTRY)
+
+def resolve_category(category: str = None) -> str:
+    """
+    Resuelve el nombre de categoría recibido en una request.
+
+    Args:
+        category (str, optional): Nombre de la categoría, o None para la predeterminada
+
+    Returns:
+        str: Categoría registrada, o None si el nombre no existe en el registro
+    """
+    if not category:
+        return DEFAULT_CATEGORY
+
+    category = category.strip().lower()
+    return category if category in PROMPT_REGISTRY else None
+
+def get_system_prompt(category: str) -> str:
+    """
+    Obtiene el system prompt de una categoría registrada.
+
+    Args:
+        category (str): Nombre de la categoría
+
+    Returns:
+        str: System prompt de la categoría
+
+    Raises:
+        KeyError: Si la categoría no está registrada
+    """
+    return PROMPT_REGISTRY[category]["prompt"]
+
+def get_difficulty_instructions(category: str) -> dict:
+    """
+    Obtiene las instrucciones de cada nivel de dificultad de una categoría registrada.
+
+    Args:
+        category (str): Nombre de la categoría
+
+    Returns:
+        dict: Texto de la instrucción por nivel de dificultad
+
+    Raises:
+        KeyError: Si la categoría no está registrada
+    """
+    return PROMPT_REGISTRY[category]["dificultades"]
+
+def list_categories() -> list:
+    """
+    Lista las categorías disponibles con su nombre visible y descripción.
+
+    Returns:
+        list: Diccionarios con las claves 'clave', 'nombre' y 'descripcion'
+    """
+    return [
+        {"clave": key, "nombre": data["nombre"], "descripcion": data["descripcion"]}
+        for key, data in PROMPT_REGISTRY.items()
+    ]
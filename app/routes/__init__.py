@@ -1,3 +1,6 @@
 from .quiz_routes import router
+from .api_routes import api_router
+from .ws_routes import ws_router
+from .admin_routes import admin_router
 
-__all__ = ["router"]
+__all__ = ["router", "api_router", "ws_router", "admin_router"]
@@ -0,0 +1,162 @@
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from app.config import settings
+from app.services import cache_manager
+from app.prompts import resolve_category
+
+# Parámetros de settings que se pueden ajustar en caliente
+TUNABLE_SETTINGS = (
+    "CACHE_MAX_BYTES",
+    "CACHE_MIN",
+    "MAX_PREVIOUS_TOPICS",
+    "QUESTION_MAX_USES",
+    "GENERATOR_WORKERS",
+    "GENERATION_INTERVAL",
+    "GENERATION_IDLE_INTERVAL",
+    "GENERATION_ERROR_INTERVAL",
+    "RATE_LIMIT_BACKOFF"
+)
+
+# Presupuesto mínimo por categoría: con menos, el cache no llega a contener las
+# CACHE_HOT_ENTRIES preguntas sin comprimir (cada una ocupa entre 1 y 2 KB) y
+# desalojaría todo su contenido
+MIN_CACHE_MAX_BYTES = 64 * 1024
+
+def require_admin(x_admin_token: str = Header(None)) -> None:
+    """
+    Verifica el token de administración del header X-Admin-Token.
+
+    La comparación es de tiempo constante. Si ADMIN_TOKEN no está configurado,
+    la API de administración queda deshabilitada. También protege los
+    endpoints de otros routers que exponen datos internos.
+
+    Args:
+        x_admin_token (str): Valor del header X-Admin-Token
+
+    Raises:
+        HTTPException: 404 si la administración está deshabilitada, 401 si el
+                       token falta o es incorrecto
+    """
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), settings.ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Token de administración inválido")
+
+admin_router = APIRouter(
+    prefix="/admin",
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(require_admin)]
+)
+
+class ConfigUpdate(BaseModel):
+    """
+    Cambios de configuración en caliente; los campos omitidos no se modifican.
+
+    Attributes:
+        CACHE_MAX_BYTES (int): Presupuesto de memoria en bytes del cache de cada
+                               categoría, al menos MIN_CACHE_MAX_BYTES
+        CACHE_MIN (int): Mínimo de preguntas por categoría antes de recargar
+        MAX_PREVIOUS_TOPICS (int): Máximo de temáticas previas a evitar
+        QUESTION_MAX_USES (int): Usos por pregunta antes de retirarla
+        GENERATOR_WORKERS (int): Hilos de precarga en paralelo
+        GENERATION_INTERVAL (float): Pausa tras cada pregunta generada
+        GENERATION_IDLE_INTERVAL (float): Pausa cuando ningún cache necesita preguntas
+        GENERATION_ERROR_INTERVAL (float): Pausa tras un error de generación
+        RATE_LIMIT_BACKOFF (float): Pausa tras alcanzar el límite de la API
+    """
+    CACHE_MAX_BYTES: Optional[int] = Field(None, ge=MIN_CACHE_MAX_BYTES)
+    CACHE_MIN: Optional[int] = Field(None, ge=0)
+    MAX_PREVIOUS_TOPICS: Optional[int] = Field(None, ge=0)
+    QUESTION_MAX_USES: Optional[int] = Field(None, ge=1)
+    GENERATOR_WORKERS: Optional[int] = Field(None, ge=0, le=32)
+    GENERATION_INTERVAL: Optional[float] = Field(None, ge=0)
+    GENERATION_IDLE_INTERVAL: Optional[float] = Field(None, gt=0)
+    GENERATION_ERROR_INTERVAL: Optional[float] = Field(None, ge=0)
+    RATE_LIMIT_BACKOFF: Optional[float] = Field(None, ge=0)
+
+class PrefillRequest(BaseModel):
+    """
+    Solicitud de precarga masiva.
+
+    Attributes:
+        cantidad (int): Preguntas a generar por categoría
+        categoria (str): Categoría a precargar; si se omite, todas
+    """
+    cantidad: int = Field(..., ge=1, le=10000)
+    categoria: Optional[str] = None
+
+def _admin_state() -> dict:
+    """
+    Construye la respuesta de estado de la administración.
+
+    Returns:
+        dict: Diccionario con la 'configuracion' efectiva y el estado del 'cache'
+    """
+    return {
+        'configuracion': {name: getattr(settings, name) for name in TUNABLE_SETTINGS},
+        'cache': cache_manager.get_cache_state()
+    }
+
+@admin_router.get('/config')
+async def admin_config_get():
+    """
+    Devuelve la configuración efectiva y el estado del cache.
+
+    Returns:
+        ORJSONResponse: Objeto con 'configuracion' y 'cache'
+    """
+    return _admin_state()
+
+@admin_router.patch('/config')
+async def admin_config_update(update: ConfigUpdate):
+    """
+    Ajusta en caliente los parámetros del cache y de la generación.
+
+    Los pools se redimensionan sin perder su contenido (al achicarlos solo se
+    desaloja el excedente) y los hilos de precarga se agregan o terminan
+    según GENERATOR_WORKERS, sin reiniciar la aplicación.
+
+    Args:
+        update (ConfigUpdate): Parámetros a modificar
+
+    Returns:
+        ORJSONResponse: Objeto con la 'configuracion' resultante y el 'cache'
+    """
+    for name, value in update.model_dump(exclude_none=True).items():
+        setattr(settings, name, value)
+
+    cache_manager.apply_settings()
+    return _admin_state()
+
+@admin_router.post('/prefill')
+async def admin_prefill(request: PrefillRequest):
+    """
+    Solicita la precarga masiva de preguntas (por ejemplo, antes de un examen).
+
+    Args:
+        request (PrefillRequest): Cantidad por categoría y categoría opcional
+
+    Returns:
+        ORJSONResponse: Objeto con 'configuracion' y 'cache' (incluye la
+                        precarga pendiente por categoría)
+        ORJSONResponse: Error 404 si la categoría no existe
+    """
+    category = None
+    if request.categoria:
+        category = resolve_category(request.categoria)
+
+        if category is None:
+            return ORJSONResponse(
+                {
+                    'error': 'Categoría inexistente',
+                    'detalle': 'La categoría solicitada no existe.'
+                },
+                status_code=404
+            )
+
+    cache_manager.prefill(request.cantidad, category)
+    return _admin_state()
@@ -0,0 +1,213 @@
+import asyncio
+import time
+from typing import List
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from app.config import settings
+from app.utils import (
+    is_question_valid,
+    grade_answers,
+    SeenFilter,
+    Deadline,
+    watch_disconnect,
+    session_limiter,
+    client_key
+)
+from app.services import cache_manager, quiz_registry, answer_stats
+from app.prompts import resolve_category, list_categories
+from app.routes.admin_routes import require_admin
+
+api_router = APIRouter(prefix="/api", default_response_class=ORJSONResponse)
+
+class QuizSubmission(BaseModel):
+    """
+    Cuerpo del envío de un quiz completo a la API JSON.
+
+    Attributes:
+        quiz_id (str): Id firmado recibido al solicitar el quiz
+        respuestas (List[str]): Opciones elegidas, en el orden de las preguntas
+    """
+    quiz_id: str
+    respuestas: List[str]
+
+def _public_question(question: dict, number: int) -> dict:
+    """
+    Construye la vista pública de una pregunta, sin respuesta ni explicación.
+
+    Args:
+        question (dict): Pregunta completa
+        number (int): Número de la pregunta dentro del quiz (desde 1)
+
+    Returns:
+        dict: Pregunta con los campos que puede ver el cliente
+    """
+    return {
+        'numero': number,
+        'pregunta': question['pregunta'],
+        'codigo': question['codigo'],
+        'respuestas': question['respuestas']
+    }
+
+async def _get_valid_question(category: str, seen: SeenFilter, deadline: Deadline) -> dict:
+    """
+    Obtiene una pregunta válida con la misma política de reintentos del flujo HTML.
+
+    Args:
+        category (str): Categoría de la pregunta
+        seen (SeenFilter): Preguntas ya incluidas en el quiz, que se saltean
+        deadline (Deadline): Plazo del request
+
+    Returns:
+        dict: Pregunta válida, o la última pregunta inválida obtenida si se
+             agotaron los intentos o el plazo
+    """
+    question = await cache_manager.get_question_from_cache_async(category=category, seen=seen, deadline=deadline)
+    attempts = 0
+
+    while not is_question_valid(question) and attempts < 10 and not deadline.done:
+        await asyncio.sleep(deadline.cap(2))
+        question = await cache_manager.get_question_from_cache_async(category=category, seen=seen, deadline=deadline)
+        attempts += 1
+
+    return question
+
+@api_router.get('/categorias')
+async def api_categories():
+    """
+    Lista las categorías de quiz disponibles.
+
+    Returns:
+        ORJSONResponse: Lista de objetos con 'clave', 'nombre' y 'descripcion'
+    """
+    return list_categories()
+
+@api_router.get('/estadisticas', dependencies=[Depends(require_admin)])
+async def api_stats(limite: int = 100):
+    """
+    Expone las estadísticas de respuestas por pregunta y por temática.
+
+    Requiere el header X-Admin-Token: las estadísticas incluyen la respuesta
+    correcta de cada pregunta.
+
+    Args:
+        limite (int, optional): Máximo de preguntas a incluir, las más respondidas primero
+
+    Returns:
+        ORJSONResponse: Objeto con 'preguntas' (intentos, aciertos, tasa de
+                        acierto y distribución de opciones por id), 'tematicas'
+                        y la cantidad de preguntas 'retiradas'
+    """
+    return answer_stats.snapshot(max(0, limite))
+
+@api_router.get('/quiz')
+async def api_quiz_get(request: Request, categoria: str = None):
+    """
+    Entrega un quiz completo en una sola respuesta JSON.
+
+    Obtiene TOTAL_QUESTIONS preguntas del cache de la categoría (en bloque,
+    completando con generación directa si faltan), registra el quiz del lado
+    del servidor y devuelve las preguntas sin sus respuestas correctas junto
+    con un id firmado.
+
+    Las preguntas faltantes se obtienen dentro del plazo REQUEST_DEADLINE y
+    se dejan de buscar si el cliente se desconecta. Cada cliente puede
+    iniciar quizzes a la frecuencia que permite su token bucket.
+
+    Args:
+        request (Request): Objeto request de FastAPI
+        categoria (str, optional): Categoría del quiz; por defecto la predeterminada
+
+    Returns:
+        ORJSONResponse: Objeto con 'quiz_id', 'categoria', 'total' y la lista 'preguntas'
+        ORJSONResponse: Error 404 si la categoría no existe
+        ORJSONResponse: Error 429 si el cliente inició demasiados quizzes
+        ORJSONResponse: Error 503 si no se pudieron obtener preguntas válidas
+    """
+    category = resolve_category(categoria)
+
+    if category is None:
+        return ORJSONResponse(
+            {
+                'error': 'Categoría inexistente',
+                'detalle': 'La categoría solicitada no existe.'
+            },
+            status_code=404
+        )
+
+    if not session_limiter.allow(client_key(request)):
+        return ORJSONResponse(
+            {
+                'error': 'Demasiados quizzes',
+                'detalle': 'Se iniciaron demasiados quizzes desde este cliente. Por favor intente nuevamente en unos segundos.'
+            },
+            status_code=429
+        )
+
+    seen = SeenFilter()
+    questions = await cache_manager.get_questions_batch_async(settings.TOTAL_QUESTIONS, category, seen)
+    deadline = Deadline(settings.REQUEST_DEADLINE)
+    watcher = asyncio.create_task(watch_disconnect(request, deadline, settings.DISCONNECT_POLL_INTERVAL))
+
+    try:
+        while len(questions) < settings.TOTAL_QUESTIONS:
+            question = await _get_valid_question(category, seen, deadline)
+
+            if not is_question_valid(question):
+                return ORJSONResponse(
+                    {
+                        'error': 'Límite de intentos superado',
+                        'detalle': 'No se pudo generar una pregunta válida. Por favor intente nuevamente más tarde.'
+                    },
+                    status_code=503
+                )
+
+            seen.add_question(question)
+            questions.append(question)
+
+    finally:
+        watcher.cancel()
+
+    quiz_id = quiz_registry.register_quiz(questions)
+
+    return {
+        'quiz_id': quiz_id,
+        'categoria': category,
+        'total': len(questions),
+        'preguntas': [
+            _public_question(question, number)
+            for number, question in enumerate(questions, start=1)
+        ]
+    }
+
+@api_router.post('/quiz/respuestas')
+async def api_quiz_submit(submission: QuizSubmission):
+    """
+    Corrige del lado del servidor el conjunto completo de respuestas de un quiz.
+
+    Cada quiz se puede corregir una única vez; los ids inválidos, expirados o
+    ya corregidos devuelven un error 404.
+
+    Args:
+        submission (QuizSubmission): Id firmado del quiz y respuestas elegidas
+
+    Returns:
+        ORJSONResponse: Objeto con 'correctas', 'total', 'tiempo' y 'errores'
+        ORJSONResponse: Error 404 si el quiz no existe o ya fue corregido
+    """
+    quiz = quiz_registry.pop_quiz(submission.quiz_id)
+
+    if quiz is None:
+        return ORJSONResponse(
+            {
+                'error': 'Quiz no encontrado',
+                'detalle': 'El id de quiz es inválido, expiró o ya fue corregido.'
+            },
+            status_code=404
+        )
+
+    answer_stats.record_quiz(quiz['preguntas'], submission.respuestas)
+    result = grade_answers(quiz['preguntas'], submission.respuestas)
+    result['tiempo'] = int(time.time() - quiz['inicio'])
+
+    return result
@@ -3,22 +3,94 @@ from fastapi import APIRouter, Request, Form, Response
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
 from app.config import settings
-from app.utils import session_manager, is_question_valid
-from app.services import cache_manager
-import time
+from app.utils import (
+    session_manager,
+    is_question_valid,
+    is_answer_correct,
+    build_error_entry,
+    difficulty_for_position,
+    SeenFilter,
+    Deadline,
+    watch_disconnect,
+    session_limiter,
+    client_key
+)
+from app.services import cache_manager, question_store, answer_log, answer_stats
+from app.prompts import DEFAULT_CATEGORY, resolve_category, list_categories
+import uuid
 import os
 
 router = APIRouter()
 templates_path = os.path.join(os.path.dirname(__file__), '..', '..', settings.TEMPLATES_DIR)
 templates = Jinja2Templates(directory=templates_path)
 
+async def _get_valid_question(request: Request, deadline: Deadline, category: str, difficulty: str = None, seen: SeenFilter = None) -> dict:
+    """
+    Obtiene una pregunta válida reintentando hasta 10 veces dentro del plazo del request.
+
+    Mientras espera, verifica si el cliente se desconectó; en ese caso cancela
+    el plazo, lo que abandona la espera del cache y evita nuevas llamadas a
+    Gemini para un cliente que ya no está.
+
+    Args:
+        request (Request): Objeto request de FastAPI
+        deadline (Deadline): Plazo del request
+        category (str): Categoría de la pregunta
+        difficulty (str, optional): Dificultad preferida
+        seen (SeenFilter, optional): Preguntas que la sesión ya vio
+
+    Returns:
+        dict: Pregunta válida, o la última pregunta inválida obtenida si se
+             agotaron los intentos o el plazo
+    """
+    watcher = asyncio.create_task(watch_disconnect(request, deadline, settings.DISCONNECT_POLL_INTERVAL))
+
+    try:
+        question = await cache_manager.get_question_from_cache_async(
+            difficulty=difficulty, category=category, seen=seen, deadline=deadline
+        )
+        attempts = 0
+
+        while not is_question_valid(question) and attempts < 10 and not deadline.done:
+            await asyncio.sleep(deadline.cap(2))
+            question = await cache_manager.get_question_from_cache_async(
+                difficulty=difficulty, category=category, seen=seen, deadline=deadline
+            )
+            attempts += 1
+
+        return question
+
+    finally:
+        watcher.cancel()
+
+def _too_many_quizzes(request: Request):
+    """
+    Construye la página de error para un cliente que agotó su límite de quizzes.
+
+    Args:
+        request (Request): Objeto request de FastAPI
+
+    Returns:
+        TemplateResponse: Página de error con código 429
+    """
+    return templates.TemplateResponse(
+        'error.html',
+        {
+            'request': request,
+            'detalle': 'Demasiados quizzes',
+            'texto': 'Se iniciaron demasiados quizzes desde este cliente. Por favor intente nuevamente en unos segundos.'
+        },
+        status_code=429
+    )
+
 @router.get('/', name="inicio")
 def inicio(request: Request):
     """
     Ruta de inicio de la aplicación.
     
-    Muestra la página principal del quiz y limpia cualquier sesión existente
-    para permitir que el usuario comience un nuevo quiz desde cero.
+    Muestra la página principal del quiz con las categorías disponibles y
+    limpia cualquier sesión existente para permitir que el usuario comience
+    un nuevo quiz desde cero.
     
     Args:
         request (Request): Objeto request de FastAPI
@@ -26,38 +98,65 @@ def inicio(request: Request):
     Returns:
         TemplateResponse: Página HTML de inicio con información del quiz
     """
-    response = templates.TemplateResponse('inicio.html', {'request': request})
+    response = templates.TemplateResponse(
+        'inicio.html',
+        {'request': request, 'categorias': list_categories()}
+    )
     session_manager.clear_session(response)
     return response
 
 @router.get("/quiz", name="quiz")
-async def quiz_get(request: Request):
+async def quiz_get(request: Request, categoria: str = None):
     """
     Muestra la pregunta actual del quiz.
     
     Esta ruta maneja la lógica principal del quiz:
-    - Valida o crea una nueva sesión
-    - Obtiene una pregunta válida del cache
-    - Maneja reintentos en caso de preguntas inválidas
+    - Valida o crea una nueva sesión (de la categoría indicada)
+    - Al crear una sesión, usa como primera pregunta la vista previa
+      compartida de la categoría, sin consumir el cache; el cache recién se
+      consume cuando el usuario responde
+    - Si todavía no hay vista previa, la genera limitando por cliente la
+      frecuencia (token bucket), ya que eso sí consume la cuota de Gemini
+    - Obtiene una pregunta válida del cache de la categoría
+    - Maneja reintentos en caso de preguntas inválidas, dentro del plazo
+      REQUEST_DEADLINE y mientras el cliente siga conectado
     - Actualiza la sesión con la pregunta actual
     
     Args:
         request (Request): Objeto request de FastAPI
+        categoria (str, optional): Categoría del quiz; si difiere de la de la
+                                  sesión actual, se comienza un quiz nuevo
         
     Returns:
         TemplateResponse: Página HTML con la pregunta actual
-        RedirectResponse: Redirección a error si no se puede generar pregunta válida
+        TemplateResponse: Página de error 429 si hay que generar la vista previa
+                          y el cliente agotó su límite de quizzes
+        RedirectResponse: Redirección a error si la categoría no existe o no se
+                          puede generar pregunta válida
     """
     session = session_manager.get_session(request)
+    category = resolve_category(categoria)
+    deadline = Deadline(settings.REQUEST_DEADLINE)
+
+    if category is None:
+        return RedirectResponse(
+            url=f'/error?detalle=Categoría%20inexistente&texto=La%20categoría%20solicitada%20no%20existe.',
+            status_code=303
+        )
+
+    if categoria and session.get('categoria', DEFAULT_CATEGORY) != category:
+        session = {}
 
     if not session_manager.is_session_valid(session):
-        new_question = await cache_manager.get_question_from_cache_async()
-        attempts = 0
-        
-        while not is_question_valid(new_question) and attempts < 10:
-            await asyncio.sleep(2)
-            new_question = await cache_manager.get_question_from_cache_async()
-            attempts += 1
+        new_question = cache_manager.get_preview_question(category)
+
+        if new_question is None:
+            if not session_limiter.allow(client_key(request)):
+                return _too_many_quizzes(request)
+
+            new_question = await _get_valid_question(request, deadline, category, difficulty_for_position(0))
+            if is_question_valid(new_question):
+                cache_manager.set_preview_question(category, new_question)
         
         if not is_question_valid(new_question):
             return RedirectResponse(
@@ -65,13 +164,11 @@ async def quiz_get(request: Request):
                 status_code=303
             )
         
-        session = session_manager.create_new_session(new_question)
+        session = session_manager.create_new_session(new_question, category)
 
-    attempts = 0
-    while not is_question_valid(session['pregunta_actual']) and attempts < 10:
-        await asyncio.sleep(2)
-        session['pregunta_actual'] = await cache_manager.get_question_from_cache_async()
-        attempts += 1
+    category = session.get('categoria', DEFAULT_CATEGORY)
+    if not is_question_valid(session['pregunta_actual']):
+        session['pregunta_actual'] = await _get_valid_question(request, deadline, category)
     
     if not is_question_valid(session['pregunta_actual']):
         return RedirectResponse(
@@ -97,10 +194,18 @@ async def quiz_post(request: Request, respuesta: str = Form(...)):
     
     Funcionalidades:
     - Valida la sesión actual
+    - Al responder la primera pregunta (cuando el quiz empieza a consumir el
+      cache) limita por cliente la frecuencia con el token bucket, de modo
+      que las visitas que nunca responden no gastan el límite del cliente
     - Compara la respuesta del usuario con la correcta
     - Actualiza el puntaje si es correcta
     - Redirige al resultado si se completaron todas las preguntas
-    - Obtiene la siguiente pregunta y actualiza la sesión
+    - Obtiene la siguiente pregunta, salteando las que la sesión ya vio,
+      dentro del plazo REQUEST_DEADLINE y mientras el cliente siga conectado
+    - Registra la respuesta en el registro de la sesión (solo ids) y en las
+      estadísticas de la pregunta recién cuando se devuelve la sesión
+      actualizada, una vez por posición
+    - Actualiza la sesión
     
     Args:
         request (Request): Objeto request de FastAPI
@@ -108,17 +213,20 @@ async def quiz_post(request: Request, respuesta: str = Form(...)):
         
     Returns:
         RedirectResponse: Redirección a la siguiente pregunta, resultado o error
+        TemplateResponse: Página de error 429 si el cliente agotó su límite de quizzes
     """
     session = session_manager.get_session(request)
     
     if not session_manager.is_session_valid(session):
         return RedirectResponse(url='/', status_code=303)
 
-    attempts = 0
-    while not is_question_valid(session['pregunta_actual']) and attempts < 10:
-        await asyncio.sleep(2)
-        session['pregunta_actual'] = await cache_manager.get_question_from_cache_async()
-        attempts += 1
+    if session['total'] == 0 and not session_limiter.allow(client_key(request)):
+        return _too_many_quizzes(request)
+
+    category = session.get('categoria', DEFAULT_CATEGORY)
+    deadline = Deadline(settings.REQUEST_DEADLINE)
+    if not is_question_valid(session['pregunta_actual']):
+        session['pregunta_actual'] = await _get_valid_question(request, deadline, category)
     
     if not is_question_valid(session['pregunta_actual']):
         return RedirectResponse(
@@ -127,30 +235,24 @@ async def quiz_post(request: Request, respuesta: str = Form(...)):
         )
 
     selection = respuesta
-    correct_answer = session['pregunta_actual']['respuesta_correcta']
+    question = session['pregunta_actual']
+    position = session['total']
+    session_id = session.setdefault('id', uuid.uuid4().hex)
+    correct = is_answer_correct(selection, question['respuesta_correcta'])
     session['total'] += 1
 
-    if selection and selection.strip() == correct_answer.strip():
+    if correct:
         session['puntaje'] += 1
 
     if session['total'] >= settings.TOTAL_QUESTIONS:
-        elapsed_time = int(time.time() - session['inicio'])
-        score = session['puntaje']
-        
-        response = RedirectResponse(
-            url=f'/resultado?correctas={score}&tiempo={elapsed_time}',
-            status_code=303
-        )
+        _log_answer(session, position, question, selection, correct)
+        response = RedirectResponse(url=f'/resultado?sesion={session_id}', status_code=303)
         session_manager.clear_session(response)
         return response
 
-    new_question = await cache_manager.get_question_from_cache_async()
-    attempts = 0
-    
-    while not is_question_valid(new_question) and attempts < 10:
-        await asyncio.sleep(2)
-        new_question = await cache_manager.get_question_from_cache_async()
-        attempts += 1
+    difficulty = difficulty_for_position(session['total'])
+    seen = SeenFilter.from_token(session.get('vistas'))
+    new_question = await _get_valid_question(request, deadline, category, difficulty, seen)
     
     if not is_question_valid(new_question):
         return RedirectResponse(
@@ -158,34 +260,89 @@ async def quiz_post(request: Request, respuesta: str = Form(...)):
             status_code=303
         )
     
+    _log_answer(session, position, question, selection, correct)
+    seen.add_question(new_question)
     session['pregunta_actual'] = new_question
+    session['vistas'] = seen.to_token()
     response = RedirectResponse(url='/quiz', status_code=303)
     session_manager.set_session(response, session)
     return response
 
+def _log_answer(session: dict, position: int, question: dict, selection: str, correct: bool) -> bool:
+    """
+    Archiva la pregunta y registra la respuesta de una posición en el registro de la sesión.
+
+    Las estadísticas de la pregunta se actualizan solo si la posición no
+    tenía respuesta, para que un reenvío no cuente otro intento.
+
+    Args:
+        session (dict): Sesión actual
+        position (int): Posición de la pregunta en el quiz, desde 0
+        question (dict): Pregunta respondida
+        selection (str): Opción elegida por el usuario
+        correct (bool): Si la respuesta fue correcta
+
+    Returns:
+        bool: True si se registró; False si la posición ya tenía respuesta
+              (reenvío de la misma cookie)
+    """
+    question_id = question_store.remember(question)
+    if not answer_log.record(session['id'], position, question_id, selection, correct, session['inicio']):
+        return False
+
+    answer_stats.record(question, selection)
+    return True
+
+def _review_errors(session_id: str) -> list:
+    """
+    Reconstruye las preguntas respondidas incorrectamente en una sesión.
+
+    Recorre el registro de respuestas de la sesión y busca cada pregunta por
+    id en el archivo de preguntas servidas. Las preguntas que ya expiraron
+    del archivo se omiten.
+
+    Args:
+        session_id (str): Id de la sesión, o None
+
+    Returns:
+        list: Entradas de error (ver build_error_entry), en orden de respuesta
+    """
+    if not session_id:
+        return []
+
+    errors = []
+    for question_id, selection, correct in answer_log.answers(session_id):
+        question = question_store.lookup(question_id) if not correct else None
+        if question is not None:
+            errors.append(build_error_entry(question, selection))
+
+    return errors
+
 @router.get('/resultado')
-def resultado(request: Request, correctas: int = 0, tiempo: int = 0):
+def resultado(request: Request, sesion: str = None):
     """
     Muestra los resultados finales del quiz.
     
-    Presenta al usuario su puntaje final, tiempo transcurrido y opcionalmente
-    las preguntas que respondió incorrectamente con sus explicaciones.
+    Presenta al usuario su puntaje final, tiempo transcurrido y las preguntas
+    que respondió incorrectamente con sus explicaciones. Todo se reconstruye
+    a partir del registro de respuestas de la sesión, sin confiar en valores
+    enviados por el cliente.
     
     Args:
         request (Request): Objeto request de FastAPI
-        correctas (int): Número de respuestas correctas
-        tiempo (int): Tiempo total en segundos
+        sesion (str, optional): Id de la sesión finalizada
         
     Returns:
         TemplateResponse: Página HTML con los resultados del quiz
     """
+    summary = answer_log.summary(sesion) if sesion else {'correctas': 0, 'tiempo': 0}
     response = templates.TemplateResponse(
         'resultado.html',
         {
             'request': request, 
-            'correctas': correctas, 
-            'tiempo': tiempo, 
-            'errores': []
+            'correctas': summary['correctas'], 
+            'tiempo': summary['tiempo'], 
+            'errores': _review_errors(sesion)
         }
     )
     return response
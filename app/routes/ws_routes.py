@@ -0,0 +1,226 @@
+import asyncio
+import time
+import orjson
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from app.config import settings
+from app.utils import (
+    is_question_valid,
+    build_error_entry,
+    difficulty_for_position,
+    SeenFilter,
+    Deadline,
+    session_limiter,
+    client_key
+)
+from app.services import cache_manager, answer_stats
+from app.prompts import resolve_category
+
+ws_router = APIRouter()
+
+async def _send(websocket: WebSocket, message: dict) -> None:
+    """
+    Envía un mensaje JSON al cliente usando el serializador rápido.
+
+    Args:
+        websocket (WebSocket): Conexión del cliente
+        message (dict): Mensaje a enviar
+    """
+    await websocket.send_text(orjson.dumps(message).decode())
+
+async def _fetch_question(number: int, category: str, seen: SeenFilter, deadline: Deadline) -> dict:
+    """
+    Obtiene la siguiente pregunta apenas esté disponible en el cache.
+
+    Espera en intervalos de WS_WAIT_INTERVAL segundos; si tras WS_MAX_WAITS
+    intervalos el cache sigue sin preguntas no vistas, genera la pregunta
+    directamente.
+
+    Args:
+        number (int): Número de la pregunta dentro del quiz (desde 1)
+        category (str): Categoría del quiz
+        seen (SeenFilter): Preguntas ya enviadas en la conexión; se le agrega la obtenida
+        deadline (Deadline): Plazo de la conexión; se cancela al desconectarse el cliente
+
+    Returns:
+        dict: Pregunta obtenida (puede ser un diccionario de error si la
+             generación directa falla)
+    """
+    difficulty = difficulty_for_position(number - 1)
+    cache_manager.record_demand(category)
+
+    for _ in range(settings.WS_MAX_WAITS):
+        if deadline.done:
+            break
+        question = await cache_manager.wait_for_cached_question_async(settings.WS_WAIT_INTERVAL, difficulty, category, seen)
+        if question is not None:
+            seen.add_question(question)
+            return question
+
+    question = await cache_manager.generate_question_async(difficulty=difficulty, category=category, deadline=deadline)
+    if is_question_valid(question):
+        seen.add_question(question)
+    return question
+
+async def _await_question(websocket: WebSocket, task: asyncio.Task, number: int) -> dict:
+    """
+    Espera la pregunta precargada informando el progreso al cliente.
+
+    Mientras la pregunta no está lista, envía un mensaje 'esperando' cada
+    WS_WAIT_INTERVAL segundos en lugar de dejar al cliente sin respuesta.
+
+    Args:
+        websocket (WebSocket): Conexión del cliente
+        task (asyncio.Task): Tarea que obtiene la pregunta
+        number (int): Número de la pregunta esperada
+
+    Returns:
+        dict: Pregunta obtenida por la tarea
+    """
+    waits = 0
+
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=settings.WS_WAIT_INTERVAL)
+        if done:
+            return task.result()
+
+        waits += 1
+        await _send(websocket, {'tipo': 'esperando', 'numero': number, 'intento': waits})
+
+async def _receive_answer(websocket: WebSocket) -> str:
+    """
+    Espera la respuesta del cliente a la pregunta actual.
+
+    Los mensajes que no son JSON o no contienen el campo 'respuesta' se
+    rechazan con un mensaje de error y se sigue esperando.
+
+    Args:
+        websocket (WebSocket): Conexión del cliente
+
+    Returns:
+        str: Opción seleccionada por el cliente
+    """
+    while True:
+        text = await websocket.receive_text()
+
+        try:
+            message = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            message = None
+
+        if isinstance(message, dict) and isinstance(message.get('respuesta'), str):
+            return message['respuesta']
+
+        await _send(websocket, {
+            'tipo': 'error',
+            'detalle': 'Mensaje inválido: se esperaba {"respuesta": "<opción>"}'
+        })
+
+@ws_router.websocket('/ws/quiz')
+async def quiz_websocket(websocket: WebSocket, categoria: str = None):
+    """
+    Canal WebSocket para responder un quiz completo en una sola conexión.
+
+    Protocolo (mensajes JSON):
+    - Servidor -> cliente 'pregunta': número, enunciado, código y opciones
+    - Cliente -> servidor: {"respuesta": "<opción elegida>"}
+    - Servidor -> cliente 'correccion': si fue correcta, respuesta correcta y explicación
+    - Servidor -> cliente 'esperando': progreso mientras la siguiente pregunta no está lista
+    - Servidor -> cliente 'resultado': puntaje, tiempo y errores al finalizar
+    - Servidor -> cliente 'error': mensaje inválido, pregunta imposible de generar
+      o demasiados quizzes iniciados desde el mismo cliente (se cierra con 1013)
+
+    La siguiente pregunta se precarga mientras el usuario responde la actual,
+    de modo que se envía apenas está disponible en el cache. Al desconectarse
+    el cliente se cancela el plazo de la conexión, por lo que la precarga
+    pendiente no inicia una generación directa con Gemini, y una pregunta ya
+    precargada que no llegó a enviarse se devuelve al cache.
+
+    Args:
+        websocket (WebSocket): Conexión del cliente
+        categoria (str, optional): Categoría del quiz; por defecto la predeterminada
+    """
+    await websocket.accept()
+
+    category = resolve_category(categoria)
+    if category is None:
+        await _send(websocket, {'tipo': 'error', 'detalle': 'La categoría solicitada no existe.'})
+        await websocket.close(code=1008)
+        return
+
+    if not session_limiter.allow(client_key(websocket)):
+        await _send(websocket, {
+            'tipo': 'error',
+            'detalle': 'Se iniciaron demasiados quizzes desde este cliente. Por favor intente nuevamente en unos segundos.'
+        })
+        await websocket.close(code=1013)
+        return
+
+    start_time = time.time()
+    score = 0
+    errors = []
+    seen = SeenFilter()
+    deadline = Deadline(settings.SESSION_MAX_AGE)
+    next_question = asyncio.create_task(_fetch_question(1, category, seen, deadline))
+    claimed = False
+
+    try:
+        for number in range(1, settings.TOTAL_QUESTIONS + 1):
+            question = await _await_question(websocket, next_question, number)
+            claimed = True
+
+            if not is_question_valid(question):
+                await _send(websocket, {
+                    'tipo': 'error',
+                    'detalle': 'No se pudo generar una pregunta válida. Por favor intente nuevamente más tarde.'
+                })
+                await websocket.close(code=1011)
+                return
+
+            await _send(websocket, {
+                'tipo': 'pregunta',
+                'numero': number,
+                'total': settings.TOTAL_QUESTIONS,
+                'pregunta': question['pregunta'],
+                'codigo': question['codigo'],
+                'respuestas': question['respuestas']
+            })
+
+            if number < settings.TOTAL_QUESTIONS:
+                next_question = asyncio.create_task(_fetch_question(number + 1, category, seen, deadline))
+                claimed = False
+
+            selection = await _receive_answer(websocket)
+            correct = answer_stats.record(question, selection)
+
+            if correct:
+                score += 1
+            else:
+                errors.append(build_error_entry(question, selection))
+
+            await _send(websocket, {
+                'tipo': 'correccion',
+                'numero': number,
+                'correcta': correct,
+                'respuesta_correcta': question['respuesta_correcta'],
+                'explicacion': question.get('explicacion', ''),
+                'correctas': score
+            })
+
+        await _send(websocket, {
+            'tipo': 'resultado',
+            'correctas': score,
+            'total': settings.TOTAL_QUESTIONS,
+            'tiempo': int(time.time() - start_time),
+            'errores': errors
+        })
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        pass
+
+    finally:
+        deadline.cancel()
+        if not next_question.done():
+            next_question.cancel()
+        elif not claimed and not next_question.cancelled() and next_question.exception() is None:
+            cache_manager.return_question(next_question.result())
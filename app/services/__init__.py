@@ -1,4 +1,8 @@
 from .gemini_service import gemini_service
 from .cache_manager import cache_manager
+from .quiz_registry import quiz_registry
+from .question_store import question_store
+from .answer_log import answer_log
+from .answer_stats import answer_stats
 
-__all__ = ["gemini_service", "cache_manager"]
+__all__ = ["gemini_service", "cache_manager", "quiz_registry", "question_store", "answer_log", "answer_stats"]
@@ -0,0 +1,108 @@
+import threading
+import time
+from cachetools import TTLCache
+from app.config import settings
+
+class AnswerLog:
+    """
+    Registro de las respuestas de cada sesión del quiz, una por posición.
+
+    Cada respuesta se guarda como (id de pregunta, opción elegida, si fue
+    correcta) bajo el id de la sesión y la posición de la pregunta en el
+    quiz, de modo que la cookie no crece con cada pregunta respondida. Los
+    resultados se reconstruyen al final a partir de este registro, buscando
+    cada id en el archivo de preguntas servidas (QuestionStore).
+
+    Una posición se registra una sola vez: los reenvíos de la misma cookie
+    (doble envío del formulario, reintentos tras un error) no duplican la
+    respuesta.
+
+    Attributes:
+        entries (TTLCache): Por id de sesión, diccionario con 'inicio', 'fin'
+                            y las 'respuestas' por posición
+        lock (threading.Lock): Lock para acceso thread-safe al registro
+    """
+
+    def __init__(self):
+        """
+        Inicializa el registro vacío.
+
+        Las sesiones expiran tras SESSION_MAX_AGE segundos, igual que la
+        cookie; como máximo se conservan ANSWER_LOG_SESSIONS sesiones.
+        """
+        self.entries = TTLCache(
+            maxsize=settings.ANSWER_LOG_SESSIONS,
+            ttl=settings.SESSION_MAX_AGE
+        )
+        self.lock = threading.Lock()
+
+    def record(self, session_id: str, position: int, question_id: str, selection: str, correct: bool, started_at: float) -> bool:
+        """
+        Registra la respuesta a la pregunta de una posición, si todavía no estaba registrada.
+
+        Args:
+            session_id (str): Id de la sesión
+            position (int): Posición de la pregunta en el quiz, desde 0
+            question_id (str): Id de la pregunta respondida
+            selection (str): Opción elegida por el usuario
+            correct (bool): Si la respuesta fue correcta
+            started_at (float): Instante de inicio del quiz (time.time)
+
+        Returns:
+            bool: True si se registró; False si la posición ya tenía respuesta
+        """
+        with self.lock:
+            log = self.entries.get(session_id)
+            if log is None:
+                log = {'inicio': started_at, 'fin': started_at, 'respuestas': {}}
+
+            if position in log['respuestas']:
+                return False
+
+            log['respuestas'][position] = (question_id, selection, correct)
+            log['fin'] = time.time()
+            self.entries[session_id] = log
+            return True
+
+    def answers(self, session_id: str) -> list:
+        """
+        Obtiene las respuestas registradas de una sesión, en orden de posición.
+
+        Args:
+            session_id (str): Id de la sesión
+
+        Returns:
+            list: Tuplas (id de pregunta, opción elegida, correcta); vacía si la
+                 sesión no existe o expiró
+        """
+        with self.lock:
+            log = self.entries.get(session_id)
+            if log is None:
+                return []
+            return [log['respuestas'][position] for position in sorted(log['respuestas'])]
+
+    def summary(self, session_id: str) -> dict:
+        """
+        Calcula el puntaje y el tiempo de una sesión a partir de sus respuestas.
+
+        Args:
+            session_id (str): Id de la sesión
+
+        Returns:
+            dict: Diccionario con 'correctas', 'total' y 'tiempo' (segundos
+                 entre el inicio y la última respuesta); ceros si la sesión no
+                 existe o expiró
+        """
+        with self.lock:
+            log = self.entries.get(session_id)
+            if log is None:
+                return {'correctas': 0, 'total': 0, 'tiempo': 0}
+
+            answers = log['respuestas'].values()
+            return {
+                'correctas': sum(1 for _, _, correct in answers if correct),
+                'total': len(answers),
+                'tiempo': int(log['fin'] - log['inicio'])
+            }
+
+answer_log = AnswerLog()
@@ -0,0 +1,301 @@
+import json
+import os
+import threading
+from app.config import settings
+from app.utils.question_index import compute_question_id, normalize_topic
+from app.utils.quiz_grader import is_answer_correct
+from app.services.cache_manager import cache_manager
+
+# Clave bajo la que se cuentan las selecciones que no son opciones de la pregunta
+_OTHER_OPTION = "otra"
+
+class _QuestionCounters:
+    """
+    Contadores incrementales de las respuestas a una pregunta.
+
+    Attributes:
+        intentos (int): Veces que se respondió la pregunta
+        correctas (int): Respuestas correctas
+        opciones (dict): Cantidad de veces que se eligió cada opción
+        respuesta_correcta (str): Respuesta correcta de la pregunta
+        tematicas (tuple): Temáticas normalizadas de la pregunta
+        categoria (str): Categoría de la pregunta
+        retirada (bool): Si la pregunta se retiró del cache por sus estadísticas
+    """
+
+    __slots__ = ("intentos", "correctas", "opciones", "respuesta_correcta", "tematicas", "categoria", "retirada")
+
+    def __init__(self, question: dict):
+        """
+        Inicializa los contadores en cero para una pregunta.
+
+        Args:
+            question (dict): Pregunta respondida
+        """
+        self.intentos = 0
+        self.correctas = 0
+        self.opciones = {option: 0 for option in question.get("respuestas") or []}
+        self.respuesta_correcta = question.get("respuesta_correcta", "")
+        self.tematicas = tuple(sorted({normalize_topic(topic) for topic in question.get("tematicas_usadas") or []}))
+        self.categoria = question.get("categoria")
+        self.retirada = False
+
+    def add(self, selection: str, correct: bool) -> None:
+        """
+        Registra una respuesta.
+
+        Args:
+            selection (str): Opción elegida
+            correct (bool): Si la respuesta fue correcta
+        """
+        self.intentos += 1
+        self.correctas += int(correct)
+        option = selection.strip() if selection else ""
+        key = option if option in self.opciones else _OTHER_OPTION
+        self.opciones[key] = self.opciones.get(key, 0) + 1
+
+    def dominant_wrong_share(self) -> float:
+        """
+        Calcula la fracción de respuestas que eligió la opción incorrecta más popular.
+
+        Solo cuentan las opciones reales de la pregunta: las selecciones que no
+        son opciones (agrupadas en _OTHER_OPTION) no indican que la pregunta
+        esté mal planteada.
+
+        Returns:
+            float: Fracción entre 0 y 1
+        """
+        if not self.intentos:
+            return 0.0
+
+        correct = self.respuesta_correcta.strip()
+        wrong = [
+            count for option, count in self.opciones.items()
+            if option != correct and option != _OTHER_OPTION
+        ]
+        return max(wrong, default=0) / self.intentos
+
+    def to_dict(self) -> dict:
+        """
+        Serializa los contadores.
+
+        Returns:
+            dict: Contadores con la tasa de acierto calculada
+        """
+        return {
+            "intentos": self.intentos,
+            "correctas": self.correctas,
+            "tasa_acierto": round(self.correctas / self.intentos, 4) if self.intentos else None,
+            "opciones": dict(self.opciones),
+            "respuesta_correcta": self.respuesta_correcta,
+            "tematicas": list(self.tematicas),
+            "categoria": self.categoria,
+            "retirada": self.retirada
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "_QuestionCounters":
+        """
+        Reconstruye los contadores a partir de su forma serializada.
+
+        Args:
+            data (dict): Contadores generados por to_dict
+
+        Returns:
+            _QuestionCounters: Contadores restaurados
+        """
+        counters = cls({
+            "respuesta_correcta": data.get("respuesta_correcta", ""),
+            "tematicas_usadas": data.get("tematicas", []),
+            "categoria": data.get("categoria")
+        })
+        counters.intentos = data.get("intentos", 0)
+        counters.correctas = data.get("correctas", 0)
+        counters.opciones = dict(data.get("opciones", {}))
+        counters.retirada = data.get("retirada", False)
+        return counters
+
+class AnswerStats:
+    """
+    Estadísticas de respuestas por pregunta y por temática, agregadas en streaming.
+
+    Cada respuesta corregida (flujo HTML, API JSON o WebSocket) actualiza
+    contadores en memoria: intentos, aciertos y distribución de las opciones
+    elegidas. Los contadores no se recalculan a partir de registros: se
+    persisten en lotes en STATS_FILE cada STATS_FLUSH_EVERY respuestas, en
+    un hilo aparte, y se vuelven a cargar al iniciar la aplicación.
+
+    Cuando una pregunta acumula STATS_RETIRE_MIN_ATTEMPTS intentos y al menos
+    STATS_RETIRE_WRONG_SHARE de las respuestas eligen la misma opción
+    incorrecta, la pregunta probablemente está mal planteada: se marca como
+    retirada y se elimina del cache para que deje de ocupar lugar.
+
+    Attributes:
+        path (str): Archivo donde se persisten las estadísticas
+        questions (dict): Contadores (_QuestionCounters) por id de pregunta
+        topics (dict): Intentos y aciertos por temática normalizada
+        pending (int): Respuestas registradas desde la última persistencia
+        lock (threading.Lock): Lock que protege los contadores
+        flush_lock (threading.Lock): Lock que serializa las escrituras del archivo
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Inicializa las estadísticas, cargando las persistidas si existen.
+
+        Args:
+            path (str, optional): Archivo de persistencia; por defecto STATS_FILE
+        """
+        self.path = path or settings.STATS_FILE
+        self.questions = {}
+        self.topics = {}
+        self.pending = 0
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self._load()
+
+        for question_id, counters in self.questions.items():
+            if counters.retirada and counters.categoria:
+                cache_manager.retire_question(question_id, counters.categoria)
+
+    def record(self, question: dict, selection: str) -> bool:
+        """
+        Registra la respuesta a una pregunta y devuelve si fue correcta.
+
+        Args:
+            question (dict): Pregunta respondida
+            selection (str): Opción elegida por el usuario
+
+        Returns:
+            bool: True si la respuesta fue correcta
+        """
+        correct = is_answer_correct(selection, question.get("respuesta_correcta"))
+        question_id = question.get("id") or compute_question_id(question)
+        retire = False
+
+        with self.lock:
+            counters = self.questions.get(question_id)
+            if counters is None:
+                counters = self.questions[question_id] = _QuestionCounters(question)
+                self._trim()
+
+            counters.add(selection, correct)
+
+            for topic in counters.tematicas:
+                totals = self.topics.setdefault(topic, {"intentos": 0, "correctas": 0})
+                totals["intentos"] += 1
+                totals["correctas"] += int(correct)
+
+            if (
+                not counters.retirada
+                and counters.intentos >= settings.STATS_RETIRE_MIN_ATTEMPTS
+                and counters.dominant_wrong_share() >= settings.STATS_RETIRE_WRONG_SHARE
+            ):
+                counters.retirada = retire = True
+
+            self.pending += 1
+            flush_due = self.pending >= settings.STATS_FLUSH_EVERY
+            if flush_due:
+                self.pending = 0
+
+        if retire and counters.categoria:
+            cache_manager.retire_question(question_id, counters.categoria)
+
+        if flush_due:
+            threading.Thread(target=self.flush, daemon=True).start()
+
+        return correct
+
+    def record_quiz(self, questions: list, selections: list) -> None:
+        """
+        Registra las respuestas de un quiz completo, emparejadas por posición.
+
+        Las preguntas sin respuesta (selección faltante o vacía) no se registran.
+
+        Args:
+            questions (list): Preguntas del quiz en el orden en que se entregaron
+            selections (list): Opciones elegidas, en el mismo orden
+        """
+        for question, selection in zip(questions, selections):
+            if selection and selection.strip():
+                self.record(question, selection)
+
+    def snapshot(self, limit: int = None) -> dict:
+        """
+        Obtiene una copia de las estadísticas actuales.
+
+        Args:
+            limit (int, optional): Máximo de preguntas a incluir, las más respondidas
+                                  primero; None las incluye todas
+
+        Returns:
+            dict: Diccionario con 'preguntas' (por id), 'tematicas' y 'retiradas'
+        """
+        with self.lock:
+            ranked = sorted(self.questions.items(), key=lambda item: item[1].intentos, reverse=True)
+            if limit is not None:
+                ranked = ranked[:limit]
+
+            return {
+                "preguntas": {question_id: counters.to_dict() for question_id, counters in ranked},
+                "tematicas": {
+                    topic: dict(
+                        totals,
+                        tasa_acierto=round(totals["correctas"] / totals["intentos"], 4) if totals["intentos"] else None
+                    )
+                    for topic, totals in self.topics.items()
+                },
+                "retiradas": sum(1 for counters in self.questions.values() if counters.retirada)
+            }
+
+    def flush(self) -> None:
+        """
+        Persiste las estadísticas en el archivo de forma atómica.
+
+        Escribe primero un archivo temporal y luego lo renombra, para que una
+        interrupción no deje el archivo a medio escribir. Los errores de
+        escritura se ignoran: los contadores siguen en memoria y se reintenta
+        en el próximo lote.
+        """
+        with self.flush_lock:
+            with self.lock:
+                data = {
+                    "preguntas": {question_id: counters.to_dict() for question_id, counters in self.questions.items()},
+                    "tematicas": {topic: dict(totals) for topic, totals in self.topics.items()}
+                }
+
+            temporary = f"{self.path}.tmp"
+            try:
+                with open(temporary, "w", encoding="utf-8") as file:
+                    json.dump(data, file, ensure_ascii=False)
+                os.replace(temporary, self.path)
+            except OSError:
+                pass
+
+    def _load(self) -> None:
+        """
+        Carga las estadísticas persistidas, si el archivo existe y es válido.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        self.questions = {
+            question_id: _QuestionCounters.from_dict(counters)
+            for question_id, counters in data.get("preguntas", {}).items()
+        }
+        self.topics = {
+            topic: {"intentos": totals.get("intentos", 0), "correctas": totals.get("correctas", 0)}
+            for topic, totals in data.get("tematicas", {}).items()
+        }
+
+    def _trim(self) -> None:
+        """
+        Descarta las preguntas registradas hace más tiempo si se supera STATS_MAX_QUESTIONS. Requiere tener el lock.
+        """
+        while len(self.questions) > settings.STATS_MAX_QUESTIONS:
+            del self.questions[next(iter(self.questions))]
+
+answer_stats = AnswerStats()
@@ -1,148 +1,610 @@
-import queue
 import threading
 import time
 import asyncio
 from app.config import settings
+from app.prompts import CATEGORIES, DEFAULT_CATEGORY
 from app.services.gemini_service import gemini_service
+from app.services.question_pool import QuestionPool
+from app.services.generation_scheduler import GenerationScheduler
 from app.utils.question_validator import is_question_valid
+from app.utils.question_index import compute_question_id, difficulty_for_position
+from app.utils.seen_filter import SeenFilter
+from app.utils.deadline import Deadline
 
 class CacheManager:
     """
     Gestor de cache de preguntas para optimizar el rendimiento del quiz.
-    
+
     Esta clase mantiene un cache en memoria de preguntas pre-generadas para
-    reducir la latencia y mejorar la experiencia del usuario. Utiliza un hilo
+    reducir la latencia y mejorar la experiencia del usuario. Utiliza hilos
     en segundo plano para mantener el cache lleno y gestiona las temáticas
     previas para evitar repeticiones.
-    
+
     Características:
-    - Cache thread-safe con queue.Queue
-    - Precarga automática en segundo plano
+    - Un pool thread-safe por categoría, indexado por temática, dificultad e id
+      y limitado por un presupuesto de bytes (CACHE_MAX_BYTES)
+    - GENERATOR_WORKERS hilos de precarga compartidos por todas las
+      categorías, que reparten la cuota de la API según la demanda reciente
+      (GenerationScheduler)
+    - Configuración ajustable en caliente (apply_settings): presupuesto de
+      los pools, usos por pregunta, cantidad de hilos y pausas de generación
+    - Precarga masiva a pedido (prefill), por encima de CACHE_MIN
+    - Precarga priorizando los buckets que se vacían
+    - Una pregunta de vista previa compartida por categoría, que se muestra
+      al iniciar un quiz sin consumir el cache
+    - Reutilización de cada pregunta hasta QUESTION_MAX_USES veces, salteando
+      las que la sesión ya vio (SeenFilter), para que el pool no se agote
     - Gestión de temáticas previas para variedad
     - Manejo de errores y límites de API
-    
+
     Attributes:
-        question_cache (Queue): Cola thread-safe para almacenar preguntas
-        previous_topics_global (list): Lista global de temáticas usadas
+        question_pools (dict): Pool indexado (QuestionPool) por categoría
+        scheduler (GenerationScheduler): Planificador de la cuota de generación
+        previous_topics_global (dict): Lista de temáticas usadas por categoría
         topics_lock (threading.Lock): Lock para acceso thread-safe a temáticas
+        previews (dict): Par (pregunta, vencimiento) de vista previa por categoría
+        previews_lock (threading.Lock): Lock para acceso thread-safe a las vistas previas
+        retired_ids (set): Ids de las preguntas retiradas por sus estadísticas
+        retired_lock (threading.Lock): Lock para acceso thread-safe a las preguntas retiradas
+        prefill_pending (dict): Preguntas de precarga masiva pendientes por categoría
+        prefill_lock (threading.Lock): Lock para acceso thread-safe a la precarga masiva
+        workers (dict): Hilos de precarga por índice
+        workers_lock (threading.Lock): Lock que protege el arranque de hilos
     """
-    
+
     def __init__(self):
         """
-        Inicializa el gestor de cache y arranca el hilo de precarga.
-        
-        Configura la cola de preguntas con el tamaño máximo definido en settings
-        e inicia el hilo daemon que se encarga de mantener el cache lleno.
+        Inicializa el gestor de cache y arranca los hilos de precarga.
+
+        Configura un pool de preguntas por categoría registrada, con el
+        presupuesto de memoria definido en settings, e inicia los hilos daemon
+        que se encargan de mantener los caches llenos.
         """
-        self.question_cache = queue.Queue(maxsize=settings.CACHE_SIZE)
-        self.previous_topics_global = []
+        self.question_pools = {
+            category: QuestionPool(
+                max_bytes=settings.CACHE_MAX_BYTES,
+                hot_entries=settings.CACHE_HOT_ENTRIES,
+                max_uses=settings.QUESTION_MAX_USES
+            )
+            for category in CATEGORIES
+        }
+        self.scheduler = GenerationScheduler(CATEGORIES)
+        self.previous_topics_global = {category: [] for category in CATEGORIES}
         self.topics_lock = threading.Lock()
-        self._start_preload_thread()
-    
-    def _start_preload_thread(self):
-        """
-        Inicia el hilo daemon para precarga de preguntas en segundo plano.
-        
-        El hilo daemon se ejecuta continuamente y se encarga de mantener
-        el cache con suficientes preguntas válidas para servir requests.
-        """
-        preload_thread = threading.Thread(target=self._preload_questions, daemon=True)
-        preload_thread.start()
-    
-    def _preload_questions(self):
-        """
-        Bucle principal del hilo de precarga de preguntas.
-        
-        Este método se ejecuta continuamente en segundo plano:
-        - Verifica si el cache necesita más preguntas
-        - Genera nuevas preguntas usando el servicio Gemini
+        self.previews = {}
+        self.previews_lock = threading.Lock()
+        self.retired_ids = set()
+        self.retired_lock = threading.Lock()
+        self.prefill_pending = {category: 0 for category in CATEGORIES}
+        self.prefill_lock = threading.Lock()
+        self.workers = {}
+        self.workers_lock = threading.Lock()
+        self._start_preload_threads()
+
+    def _start_preload_threads(self):
+        """
+        Inicia los hilos daemon de precarga que falten hasta GENERATOR_WORKERS.
+
+        Cada hilo se ejecuta continuamente y se encarga de mantener los caches
+        con suficientes preguntas válidas para servir requests. Los hilos cuyo
+        índice queda fuera de GENERATOR_WORKERS terminan solos al completar su
+        iteración actual.
+        """
+        with self.workers_lock:
+            for index in range(settings.GENERATOR_WORKERS):
+                worker = self.workers.get(index)
+                if worker is None or not worker.is_alive():
+                    worker = threading.Thread(target=self._preload_questions, args=(index,), daemon=True)
+                    self.workers[index] = worker
+                    worker.start()
+
+    def _preload_questions(self, index: int):
+        """
+        Bucle principal de un hilo de precarga de preguntas.
+
+        Este método se ejecuta continuamente en segundo plano mientras el
+        índice del hilo sea menor que GENERATOR_WORKERS:
+        - Determina qué categorías necesitan más preguntas (por debajo de
+          CACHE_MIN o con precarga masiva pendiente, y con lugar en su
+          presupuesto de memoria)
+        - Elige una de ellas según el reparto de cuota del planificador
+        - Genera nuevas preguntas usando el servicio Gemini, evitando las
+          temáticas sobrerrepresentadas y pidiendo la dificultad más escasa
         - Maneja errores de API y límites de rate
         - Actualiza las temáticas globales para evitar repeticiones
-        
+
         Manejo de errores:
-        - RESOURCE_EXHAUSTED: Espera 35 segundos (límite de API)
-        - Otros errores: Espera 5 segundos antes de reintentar
+        - RESOURCE_EXHAUSTED: Espera RATE_LIMIT_BACKOFF segundos (límite de API)
+        - Otros errores: Espera GENERATION_ERROR_INTERVAL segundos antes de reintentar
+
+        Args:
+            index (int): Índice del hilo entre los hilos de precarga
         """
-        while True:
-            if self.question_cache.qsize() < settings.CACHE_MIN:
+        while index < settings.GENERATOR_WORKERS:
+            category = self.scheduler.next_category(self._categories_needing_questions())
+
+            if category is not None:
                 try:
-                    with self.topics_lock:
-                        previous_topics = list(self.previous_topics_global)
-                    
-                    question = gemini_service.generate_question(previous_topics)
-                    
-                    if is_question_valid(question):
-                        self.question_cache.put(question)
-                        
-                        with self.topics_lock:
-                            self.previous_topics_global.extend(question.get("tematicas_usadas", [])) #Se agregan las nuevas temáticas a la lista
-                            if len(self.previous_topics_global) > settings.MAX_PREVIOUS_TOPICS:
-                                self.previous_topics_global = [] #Se asegura que no se acumulen demasiadas temáticas previas
-                    
-                    time.sleep(5)
-                    
+                    self._generate_for_category(category)
+                    time.sleep(settings.GENERATION_INTERVAL)
+
                 except Exception as e:
                     if "RESOURCE_EXHAUSTED" in str(e):
-                        time.sleep(35)
+                        time.sleep(settings.RATE_LIMIT_BACKOFF)
                     else:
-                        time.sleep(5)
+                        time.sleep(settings.GENERATION_ERROR_INTERVAL)
             else:
-                time.sleep(2)
-    
-    async def get_question_from_cache_async(self, previous_topics: list = None) -> dict:
+                time.sleep(settings.GENERATION_IDLE_INTERVAL)
+
+    def _categories_needing_questions(self) -> list:
+        """
+        Obtiene las categorías a las que conviene generarles preguntas.
+
+        Una categoría califica si está por debajo de CACHE_MIN o tiene precarga
+        masiva pendiente, siempre que su pool tenga lugar. La precarga
+        pendiente de un pool lleno se descarta.
+
+        Returns:
+            list: Categorías elegibles para generar
+        """
+        eligible = []
+
+        with self.prefill_lock:
+            for category, pool in self.question_pools.items():
+                if pool.is_full():
+                    self.prefill_pending[category] = 0
+                elif pool.qsize() < settings.CACHE_MIN or self.prefill_pending[category] > 0:
+                    eligible.append(category)
+
+        return eligible
+
+    def _generate_for_category(self, category: str) -> None:
+        """
+        Genera una pregunta para una categoría y la agrega a su pool.
+
+        Args:
+            category (str): Categoría para la que se genera la pregunta
+        """
+        pool = self.question_pools[category]
+
+        with self.topics_lock:
+            previous_topics = list(self.previous_topics_global[category])
+
+        for topic in pool.overrepresented_topics():
+            if topic not in previous_topics:
+                previous_topics.append(topic)
+
+        difficulty = pool.most_depleted_difficulty()
+        self.scheduler.record_generation(category)
+        question = gemini_service.generate_question(previous_topics, difficulty, category)
+
+        if is_question_valid(question):
+            if pool.put(question):
+                with self.prefill_lock:
+                    self.prefill_pending[category] = max(0, self.prefill_pending[category] - 1)
+
+            with self.topics_lock:
+                self.previous_topics_global[category].extend(question.get("tematicas_usadas", [])) #Se agregan las nuevas temáticas a la lista
+                if len(self.previous_topics_global[category]) > settings.MAX_PREVIOUS_TOPICS:
+                    self.previous_topics_global[category] = [] #Se asegura que no se acumulen demasiadas temáticas previas
+
+    async def get_question_from_cache_async(self, previous_topics: list = None, difficulty: str = None, category: str = DEFAULT_CATEGORY, seen: SeenFilter = None, deadline: Deadline = None) -> dict:
         """
         Obtiene una pregunta del cache de forma asíncrona.
-        
-        Intenta obtener una pregunta pre-generada del cache. Si no hay preguntas
-        disponibles o la pregunta no es válida, genera una nueva directamente.
-        
+
+        Intenta obtener una pregunta pre-generada del cache de la categoría,
+        preferentemente del bucket de la dificultad indicada. Si no hay
+        preguntas disponibles o la pregunta no es válida, genera una nueva
+        directamente.
+
+        Con un plazo, la espera se limita al tiempo restante y se abandona
+        (liberando el hilo del executor) si el plazo se cancela; la
+        generación directa no se realiza si el plazo ya terminó.
+
         Args:
             previous_topics (list, optional): Temáticas previas para evitar repetición
-            
+            difficulty (str, optional): Dificultad preferida (ver DIFFICULTY_LEVELS)
+            category (str, optional): Categoría de la pregunta
+            seen (SeenFilter, optional): Preguntas que la sesión ya vio
+            deadline (Deadline, optional): Plazo del request
+
         Returns:
-            dict: Pregunta válida lista para usar en el quiz
-            
+            dict: Pregunta válida lista para usar en el quiz, o diccionario de
+                 error si no se pudo obtener
+
         Nota:
-            Utiliza run_in_executor para hacer thread-safe la operación de queue
+            Utiliza run_in_executor para hacer thread-safe la operación del pool
             en el contexto asíncrono de FastAPI.
         """
         loop = asyncio.get_running_loop()
-        
+        self.scheduler.record_demand(category)
+        timeout = deadline.cap(10) if deadline is not None else 10
+
         try:
             question = await loop.run_in_executor(
-                None, 
-                lambda: self.question_cache.get(timeout=10)
+                None,
+                lambda: self._take_question(category, difficulty, timeout=timeout, seen=seen, deadline=deadline)
             )
-            
+
             if not is_question_valid(question):
-                return gemini_service.generate_question(previous_topics)
-            
+                return await self.generate_question_async(previous_topics, category=category, deadline=deadline)
+
             return question
-            
+
         except Exception:
-            question = gemini_service.generate_question(previous_topics)
-            return question
-    
-    def get_cache_size(self) -> int:
+            return await self.generate_question_async(previous_topics, category=category, deadline=deadline)
+
+    async def get_questions_batch_async(self, count: int, category: str = DEFAULT_CATEGORY, seen: SeenFilter = None) -> list:
+        """
+        Obtiene varias preguntas válidas del cache en una sola operación.
+
+        Extrae hasta `count` preguntas disponibles sin bloquear, en una única
+        llamada al executor, en lugar de realizar una espera por pregunta.
+        Las dificultades se alternan como en una sesión del flujo HTML, las
+        preguntas inválidas se descartan y nunca se repite una pregunta.
+
+        Args:
+            count (int): Cantidad máxima de preguntas a extraer
+            category (str, optional): Categoría de las preguntas
+            seen (SeenFilter, optional): Preguntas ya vistas; se le agregan las extraídas
+
+        Returns:
+            list: Preguntas válidas obtenidas (puede contener menos de `count`
+                 si el cache no tenía suficientes)
+        """
+        loop = asyncio.get_running_loop()
+        self.scheduler.record_demand(category, count)
+        return await loop.run_in_executor(None, self._drain_valid_questions, count, category, seen)
+
+    async def wait_for_cached_question_async(self, timeout: float, difficulty: str = None, category: str = DEFAULT_CATEGORY, seen: SeenFilter = None) -> dict:
+        """
+        Espera hasta `timeout` segundos a que haya una pregunta válida en el cache.
+
+        A diferencia de get_question_from_cache_async, no genera preguntas
+        directamente si el cache está vacío: permite al llamador informar el
+        progreso de la espera y decidir cuándo recurrir a la generación directa.
+
+        Si la espera se cancela (por ejemplo, porque el cliente se desconectó)
+        y la pregunta llega igualmente, se devuelve al cache para no perderla.
+
+        Args:
+            timeout (float): Tiempo máximo de espera en segundos
+            difficulty (str, optional): Dificultad preferida (ver DIFFICULTY_LEVELS)
+            category (str, optional): Categoría de la pregunta
+            seen (SeenFilter, optional): Preguntas que la sesión ya vio
+
+        Returns:
+            dict: Pregunta válida, o None si no llegó ninguna a tiempo
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, self._get_cached_question, category, timeout, difficulty, seen)
+
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(self._return_unclaimed_question)
+            raise
+
+    async def generate_question_async(self, previous_topics: list = None, difficulty: str = None, category: str = DEFAULT_CATEGORY, deadline: Deadline = None) -> dict:
+        """
+        Genera una pregunta directamente con Gemini sin bloquear el event loop.
+
+        Args:
+            previous_topics (list, optional): Temáticas previas para evitar repetición
+            difficulty (str, optional): Dificultad objetivo (ver DIFFICULTY_LEVELS)
+            category (str, optional): Categoría de la pregunta
+            deadline (Deadline, optional): Plazo del request; limita el timeout
+                                          de la llamada y la evita si ya terminó
+
+        Returns:
+            dict: Pregunta generada, o diccionario de error si la generación falla
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            lambda: gemini_service.generate_question(previous_topics, difficulty, category, deadline)
+        )
+
+    def get_preview_question(self, category: str = DEFAULT_CATEGORY) -> dict:
+        """
+        Obtiene la pregunta de vista previa compartida de una categoría.
+
+        La vista previa es la primera pregunta de todo quiz nuevo. Se toma del
+        pool sin servirla (no consume usos ni la extrae) y se comparte durante
+        PREVIEW_TTL segundos, de modo que los requests que nunca devuelven la
+        cookie (bots, previsualizadores de enlaces, chequeos de salud) no
+        vacían el cache.
+
+        Las preguntas retiradas nunca se usan como vista previa.
+
+        Args:
+            category (str, optional): Categoría de la pregunta
+
+        Returns:
+            dict: Pregunta de vista previa, o None si todavía no hay ninguna
+        """
+        now = time.monotonic()
+
+        with self.previews_lock:
+            preview, expires_at = self.previews.get(category, (None, 0.0))
+            if preview is not None and now < expires_at:
+                return preview
+
+        if preview is not None and self.is_retired(preview):
+            preview = None
+
+        candidate = self.question_pools[category].peek()
+        if candidate is None or self.is_retired(candidate):
+            return preview
+
+        self.set_preview_question(category, candidate)
+        return candidate
+
+    def set_preview_question(self, category: str, question: dict) -> None:
+        """
+        Establece la pregunta de vista previa de una categoría por PREVIEW_TTL segundos.
+
+        Args:
+            category (str): Categoría de la pregunta
+            question (dict): Pregunta válida
+        """
+        if self.is_retired(question):
+            return
+
+        with self.previews_lock:
+            self.previews[category] = (question, time.monotonic() + settings.PREVIEW_TTL)
+
+    def prefill(self, count: int, category: str = None) -> dict:
+        """
+        Solicita una precarga masiva de preguntas, por encima de CACHE_MIN.
+
+        Los hilos de precarga generan las preguntas pendientes con el mismo
+        reparto de cuota y las mismas pausas que la precarga normal, hasta
+        completarlas o hasta que el pool alcance su presupuesto de bytes.
+
+        Args:
+            count (int): Preguntas a generar por categoría
+            category (str, optional): Categoría a precargar; None precarga todas
+
+        Returns:
+            dict: Preguntas de precarga pendientes por categoría
+        """
+        categories = [category] if category is not None else list(self.question_pools)
+
+        with self.prefill_lock:
+            for name in categories:
+                self.prefill_pending[name] += count
+            return dict(self.prefill_pending)
+
+    def apply_settings(self) -> None:
+        """
+        Aplica en caliente los cambios de configuración de settings.
+
+        Redimensiona los pools a CACHE_MAX_BYTES sin descartar su contenido
+        (salvo el excedente si se achican), actualiza QUESTION_MAX_USES y
+        arranca los hilos de precarga que falten hasta GENERATOR_WORKERS; los
+        hilos sobrantes terminan solos. CACHE_MIN, MAX_PREVIOUS_TOPICS y las
+        pausas de generación se leen de settings en cada iteración.
+        """
+        for pool in self.question_pools.values():
+            pool.resize(settings.CACHE_MAX_BYTES)
+            pool.set_max_uses(settings.QUESTION_MAX_USES)
+
+        self._start_preload_threads()
+
+    def get_cache_state(self) -> dict:
+        """
+        Obtiene el estado completo del cache para la administración.
+
+        Returns:
+            dict: Diccionario con 'categorias' (memoria, preguntas por
+                 dificultad y precarga pendiente de cada una), 'reparto' de la
+                 cuota de generación e 'hilos_activos' de precarga
+        """
+        with self.prefill_lock:
+            pending = dict(self.prefill_pending)
+
+        with self.workers_lock:
+            active_workers = sum(1 for worker in self.workers.values() if worker.is_alive())
+
+        return {
+            "categorias": {
+                category: {
+                    "memoria": pool.memory_footprint(),
+                    "dificultades": pool.bucket_sizes()["dificultades"],
+                    "precarga_pendiente": pending[category]
+                }
+                for category, pool in self.question_pools.items()
+            },
+            "reparto": self.get_generation_shares(),
+            "hilos_activos": active_workers
+        }
+
+    def record_demand(self, category: str, amount: int = 1) -> None:
+        """
+        Registra demanda de preguntas de una categoría para el reparto de cuota.
+
+        Args:
+            category (str): Categoría solicitada
+            amount (int, optional): Cantidad de preguntas solicitadas
+        """
+        self.scheduler.record_demand(category, amount)
+
+    def _take_question(self, category: str, difficulty: str, timeout: float, seen: SeenFilter = None, deadline: Deadline = None) -> dict:
+        """
+        Obtiene una pregunta del pool, preferentemente de la dificultad indicada.
+
+        Si el bucket de esa dificultad no tiene preguntas sin ver, toma la
+        pregunta más antigua no vista de cualquier bucket, esperando como
+        máximo `timeout` segundos. Con un plazo, la espera se hace en tramos
+        de DISCONNECT_POLL_INTERVAL segundos y se abandona si el plazo termina.
+
+        Args:
+            category (str): Categoría de la pregunta
+            difficulty (str): Dificultad preferida, o None para cualquiera
+            timeout (float): Tiempo máximo de espera en segundos
+            seen (SeenFilter, optional): Preguntas que se deben saltear
+            deadline (Deadline, optional): Plazo del request
+
+        Returns:
+            dict: Pregunta obtenida, o None si no llegó ninguna a tiempo
+        """
+        pool = self.question_pools[category]
+
+        if difficulty is not None:
+            question = pool.take_from_difficulty(difficulty, seen=seen)
+            if question is not None:
+                return question
+
+        if deadline is None:
+            return pool.take(timeout=timeout, seen=seen)
+
+        expires_at = time.monotonic() + timeout
+        while True:
+            remaining = max(0.0, expires_at - time.monotonic())
+            question = pool.take(timeout=min(settings.DISCONNECT_POLL_INTERVAL, remaining), seen=seen)
+            if question is not None or deadline.done or remaining <= 0:
+                return question
+
+    def _get_cached_question(self, category: str, timeout: float, difficulty: str = None, seen: SeenFilter = None) -> dict:
+        """
+        Extrae una pregunta del cache esperando como máximo `timeout` segundos.
+
+        Args:
+            category (str): Categoría de la pregunta
+            timeout (float): Tiempo máximo de espera en segundos
+            difficulty (str, optional): Dificultad preferida
+            seen (SeenFilter, optional): Preguntas que se deben saltear
+
+        Returns:
+            dict: Pregunta válida, o None si no llegó ninguna a tiempo
+        """
+        question = self._take_question(category, difficulty, timeout, seen)
+        return question if is_question_valid(question) else None
+
+    def _return_unclaimed_question(self, future: asyncio.Future) -> None:
+        """
+        Devuelve al cache una pregunta extraída para una espera ya cancelada.
+
+        Args:
+            future (asyncio.Future): Futuro de la extracción abandonada
+        """
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        self.return_question(future.result())
+
+    def return_question(self, question: dict) -> None:
+        """
+        Devuelve al cache de su categoría una pregunta extraída que no llegó a servirse.
+
+        Las preguntas inválidas y las retiradas por sus estadísticas no se devuelven.
+
+        Args:
+            question (dict): Pregunta extraída, o None
+        """
+        if is_question_valid(question) and not self.is_retired(question):
+            self.question_pools[question.get("categoria", DEFAULT_CATEGORY)].put(question)
+
+    def _drain_valid_questions(self, count: int, category: str, seen: SeenFilter = None) -> list:
+        """
+        Extrae sin bloquear hasta `count` preguntas válidas y distintas del cache.
+
+        Args:
+            count (int): Cantidad máxima de preguntas a extraer
+            category (str): Categoría de las preguntas
+            seen (SeenFilter, optional): Preguntas ya vistas; se le agregan las extraídas
+
+        Returns:
+            list: Preguntas válidas extraídas del cache
+        """
+        questions = []
+        seen = seen if seen is not None else SeenFilter()
+
+        while len(questions) < count:
+            question = self._take_question(category, difficulty_for_position(len(questions)), timeout=0, seen=seen)
+            if question is None:
+                break
+
+            seen.add_question(question)
+
+            if is_question_valid(question):
+                questions.append(question)
+
+        return questions
+
+    def retire_question(self, question_id: str, category: str) -> bool:
+        """
+        Elimina definitivamente una pregunta del cache de su categoría.
+
+        La pregunta queda registrada como retirada: no vuelve al cache si
+        estaba extraída para una espera cancelada, y deja de usarse como
+        vista previa aunque no haya vencido su PREVIEW_TTL.
+
+        Args:
+            question_id (str): Id de la pregunta
+            category (str): Categoría de la pregunta
+
+        Returns:
+            bool: True si la pregunta estaba en el cache
+        """
+        with self.retired_lock:
+            self.retired_ids.add(question_id)
+
+        with self.previews_lock:
+            preview, _ = self.previews.get(category, (None, 0.0))
+            if preview is not None and preview.get("id") == question_id:
+                del self.previews[category]
+
+        pool = self.question_pools.get(category)
+        return pool is not None and pool.take_by_id(question_id) is not None
+
+    def is_retired(self, question: dict) -> bool:
+        """
+        Indica si una pregunta fue retirada por sus estadísticas.
+
+        Args:
+            question (dict): Pregunta a verificar
+
+        Returns:
+            bool: True si la pregunta está retirada
+        """
+        question_id = question.get("id") or compute_question_id(question)
+        with self.retired_lock:
+            return question_id in self.retired_ids
+
+    def get_cache_size(self, category: str = None) -> int:
         """
         Obtiene el número actual de preguntas en cache.
-        
+
+        Args:
+            category (str, optional): Categoría a consultar; None suma todas
+
         Returns:
             int: Cantidad de preguntas disponibles en el cache
         """
-        return self.question_cache.qsize()
-    
+        if category is not None:
+            return self.question_pools[category].qsize()
+
+        return sum(pool.qsize() for pool in self.question_pools.values())
+
+    def get_generation_shares(self) -> dict:
+        """
+        Obtiene la fracción actual de la cuota de generación de cada categoría.
+
+        Returns:
+            dict: Fracción (entre 0 y 1) por categoría
+        """
+        return self.scheduler.shares()
+
     def clear_cache(self):
         """
         Vacía completamente el cache de preguntas.
-        
+
         Útil para reiniciar el sistema o limpiar preguntas inválidas.
-        Remueve todas las preguntas del cache de forma thread-safe.
+        Remueve todas las preguntas de todas las categorías de forma thread-safe.
         """
-        while not self.question_cache.empty():
-            try:
-                self.question_cache.get_nowait()
-            except queue.Empty:
-                break
+        for pool in self.question_pools.values():
+            pool.clear()
 
 cache_manager = CacheManager()
@@ -1,8 +1,10 @@
 import json
 from google import genai
+from google.genai import types
 from app.config import settings
-from app.prompts import build_prompt_with_previous_topics
+from app.prompts import build_prompt_with_previous_topics, get_system_prompt, get_difficulty_instructions, DEFAULT_CATEGORY
 from app.utils.question_validator import is_question_valid, validate_question_structure
+from app.utils.deadline import Deadline
 
 class GeminiService:
     """
@@ -24,23 +26,33 @@ class GeminiService:
         """
         Inicializa el servicio Gemini con la configuración de API.
         
-        Configura el cliente usando la clave de API desde settings y
-        establece el modelo específico para generación de preguntas.
+        Configura el cliente usando la clave de API desde settings, con un
+        timeout HTTP explícito de GEMINI_TIMEOUT segundos, y establece el
+        modelo específico para generación de preguntas.
         """
-        self.client = genai.Client(api_key=settings.GENAI_API_KEY)
+        self.client = genai.Client(
+            api_key=settings.GENAI_API_KEY,
+            http_options=types.HttpOptions(timeout=settings.GEMINI_TIMEOUT * 1000)
+        )
         self.model_name = "gemini-2.5-flash-lite-preview-06-17"
     
-    def generate_question(self, previous_topics: list = None) -> dict:
+    def generate_question(self, previous_topics: list = None, difficulty: str = None, category: str = DEFAULT_CATEGORY, deadline: Deadline = None) -> dict:
         """
         Genera una nueva pregunta de quiz usando Gemini AI.
         
         Construye un prompt personalizado con las temáticas previas para evitar
         repeticiones, envía la solicitud a Gemini y procesa la respuesta para
         obtener una pregunta estructurada.
+
+        Si se indica un plazo, la llamada no se realiza cuando el plazo ya
+        venció o fue cancelado, y su timeout HTTP se limita al tiempo restante.
         
         Args:
             previous_topics (list, optional): Lista de temáticas usadas previamente
                                             para evitar repetición en la nueva pregunta
+            difficulty (str, optional): Dificultad objetivo (ver DIFFICULTY_LEVELS)
+            category (str, optional): Categoría del registro de prompts a utilizar
+            deadline (Deadline, optional): Plazo del request que solicita la pregunta
             
         Returns:
             dict: Pregunta generada con estructura válida, o diccionario de error
@@ -53,21 +65,45 @@ class GeminiService:
                 "respuestas": ["Opción A", "Opción B", "Opción C", "Opción D"],
                 "respuesta_correcta": "Respuesta correcta",
                 "explicacion": "Explicación detallada",
-                "tematicas_usadas": ["tema1", "tema2"]
+                "tematicas_usadas": ["tema1", "tema2"],
+                "categoria": "Categoría del registro de prompts"
             }
         """
         if previous_topics is None:
             previous_topics = []
+
+        config = None
+        if deadline is not None:
+            if deadline.done:
+                return {
+                    "error": "Deadline exceeded",
+                    "detalle": "The request was cancelled or ran out of time",
+                    "texto": "API call skipped"
+                }
+
+            timeout = max(1, int(deadline.cap(settings.GEMINI_TIMEOUT) * 1000))
+            config = types.GenerateContentConfig(http_options=types.HttpOptions(timeout=timeout))
         
-        prompt = build_prompt_with_previous_topics(previous_topics)
+        prompt = build_prompt_with_previous_topics(
+            previous_topics,
+            difficulty,
+            get_system_prompt(category),
+            get_difficulty_instructions(category)
+        )
         
         try:
             response = self.client.models.generate_content(
                 model=self.model_name,
-                contents=prompt
+                contents=prompt,
+                config=config
             )
             
-            return self._process_response(response)
+            question = self._process_response(response)
+            
+            if is_question_valid(question):
+                question["categoria"] = category
+            
+            return question
             
         except Exception as e:
             return {
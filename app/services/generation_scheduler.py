@@ -0,0 +1,161 @@
+import threading
+import time
+from app.config import settings
+
+class _DecayingCounter:
+    """
+    Contador con decaimiento exponencial según una vida media.
+
+    Attributes:
+        value (float): Valor acumulado al momento de la última actualización
+        updated_at (float): Instante (time.monotonic) de la última actualización
+    """
+
+    __slots__ = ("value", "updated_at")
+
+    def __init__(self):
+        """
+        Inicializa el contador en cero.
+        """
+        self.value = 0.0
+        self.updated_at = time.monotonic()
+
+    def read(self, now: float, half_life: float) -> float:
+        """
+        Devuelve el valor decaído hasta `now` y lo deja actualizado.
+
+        Args:
+            now (float): Instante actual (time.monotonic)
+            half_life (float): Vida media en segundos
+
+        Returns:
+            float: Valor decaído
+        """
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.value *= 0.5 ** (elapsed / half_life)
+            self.updated_at = now
+        return self.value
+
+    def add(self, amount: float, now: float, half_life: float) -> None:
+        """
+        Suma `amount` al valor decaído hasta `now`.
+
+        Args:
+            amount (float): Cantidad a sumar
+            now (float): Instante actual (time.monotonic)
+            half_life (float): Vida media en segundos
+        """
+        self.value = self.read(now, half_life) + amount
+
+class GenerationScheduler:
+    """
+    Planificador que reparte la cuota de generación de Gemini entre categorías.
+
+    Cada categoría recibe una fracción de las generaciones proporcional a su
+    demanda reciente (preguntas solicitadas, con decaimiento exponencial),
+    con un mínimo garantizado de CATEGORY_MIN_SHARE. Entre las categorías que
+    necesitan preguntas se elige la más atrasada respecto de su fracción, de
+    modo que ninguna cuota queda ociosa si solo una categoría necesita recargar.
+
+    Attributes:
+        categories (tuple): Categorías planificadas
+        demand (dict): Demanda reciente por categoría
+        generated (dict): Generaciones recientes por categoría
+        lock (threading.Lock): Lock para acceso thread-safe a los contadores
+    """
+
+    def __init__(self, categories: tuple):
+        """
+        Inicializa los contadores de cada categoría.
+
+        Args:
+            categories (tuple): Categorías a planificar
+        """
+        self.categories = tuple(categories)
+        self.demand = {category: _DecayingCounter() for category in self.categories}
+        self.generated = {category: _DecayingCounter() for category in self.categories}
+        self.lock = threading.Lock()
+
+    def record_demand(self, category: str, amount: int = 1) -> None:
+        """
+        Registra preguntas solicitadas por los usuarios de una categoría.
+
+        Args:
+            category (str): Categoría solicitada
+            amount (int, optional): Cantidad de preguntas solicitadas
+        """
+        with self.lock:
+            self.demand[category].add(amount, time.monotonic(), settings.DEMAND_HALF_LIFE)
+
+    def record_generation(self, category: str) -> None:
+        """
+        Registra que se consumió una generación de la cuota para una categoría.
+
+        Args:
+            category (str): Categoría para la que se generó
+        """
+        with self.lock:
+            self.generated[category].add(1, time.monotonic(), settings.DEMAND_HALF_LIFE)
+
+    def shares(self) -> dict:
+        """
+        Calcula la fracción de la cuota que corresponde a cada categoría.
+
+        Returns:
+            dict: Fracción (entre 0 y 1) por categoría; las fracciones suman 1
+        """
+        with self.lock:
+            return self._shares(time.monotonic())
+
+    def next_category(self, eligible: list) -> str:
+        """
+        Elige para qué categoría usar la próxima generación.
+
+        Args:
+            eligible (list): Categorías cuyo cache necesita preguntas
+
+        Returns:
+            str: Categoría elegida, o None si ninguna es elegible
+        """
+        if not eligible:
+            return None
+
+        with self.lock:
+            now = time.monotonic()
+            shares = self._shares(now)
+            return min(
+                eligible,
+                key=lambda category: (
+                    self.generated[category].read(now, settings.DEMAND_HALF_LIFE)
+                    / max(shares[category], 1e-9)
+                )
+            )
+
+    def _shares(self, now: float) -> dict:
+        """
+        Calcula las fracciones de cuota. Requiere tener el lock.
+
+        Args:
+            now (float): Instante actual (time.monotonic)
+
+        Returns:
+            dict: Fracción por categoría
+        """
+        count = len(self.categories)
+        floor = min(settings.CATEGORY_MIN_SHARE, 1 / count)
+        free = 1 - floor * count
+
+        demand = {
+            category: counter.read(now, settings.DEMAND_HALF_LIFE)
+            for category, counter in self.demand.items()
+        }
+        total_demand = sum(demand.values())
+
+        if total_demand <= 0:
+            return {category: 1 / count for category in self.categories}
+
+        return {
+            category: floor + free * demand[category] / total_demand
+            for category in self.categories
+        }
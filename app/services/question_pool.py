@@ -0,0 +1,444 @@
+import threading
+import time
+from collections import OrderedDict
+from app.utils.question_index import (
+    DIFFICULTY_LEVELS,
+    compute_question_id,
+    estimate_difficulty,
+    normalize_topic
+)
+from app.utils.question_record import QuestionRecord
+
+# Costo aproximado de cada entrada de índice (dict u OrderedDict) por pregunta
+_INDEX_ENTRY_BYTES = 100
+
+# Cantidad máxima de candidatas que se revisan al saltear preguntas ya vistas
+_SEEN_SCAN_LIMIT = 64
+
+class QuestionPool:
+    """
+    Pool indexado de preguntas pre-generadas, particionado por temática y dificultad.
+
+    Reemplaza a la cola FIFO del cache: además de "tomar la más antigua",
+    permite tomar en tiempo constante una pregunta de una dificultad concreta
+    o extraerla por id, y conoce en todo momento cuántas preguntas tiene cada
+    bucket. Los buckets por temática guían al productor: las temáticas
+    sobrerrepresentadas se evitan al generar.
+
+    Cada bucket es un OrderedDict de ids en orden de llegada, por lo que tanto
+    extraer el primero como eliminar un id arbitrario son operaciones O(1).
+    Al tomar una pregunta se la desvincula del resto de sus buckets (una
+    cantidad acotada: sus temáticas y su dificultad).
+
+    Las preguntas se guardan como QuestionRecord y el pool se limita por un
+    presupuesto total de bytes en lugar de por cantidad de entradas. Solo las
+    primeras `hot_entries` preguntas (las próximas a servirse) conservan la
+    explicación sin comprimir; el resto la guarda comprimida y se descomprime
+    al acercarse a la salida.
+
+    Con `max_uses` mayor a 1 el pool funciona en modo reutilización: servir
+    una pregunta no la extrae, sino que incrementa su contador de usos y la
+    rota al final de sus buckets; recién se retira al agotar su presupuesto
+    de usos. Las operaciones de toma aceptan un conjunto de ids ya vistos
+    (por ejemplo un SeenFilter) y saltean esas preguntas, revisando como
+    máximo _SEEN_SCAN_LIMIT candidatas por bucket.
+
+    Attributes:
+        max_bytes (int): Presupuesto de memoria del pool en bytes
+        hot_entries (int): Cantidad de preguntas que se mantienen sin comprimir
+        max_uses (int): Veces que se sirve cada pregunta antes de retirarla
+        nbytes (int): Memoria aproximada ocupada por el pool en bytes
+        records (dict): Preguntas (QuestionRecord) indexadas por id
+        order (OrderedDict): Ids de todas las preguntas en orden de llegada
+        cold (OrderedDict): Ids de las preguntas con explicación comprimida
+        topic_buckets (dict): Ids por temática normalizada
+        difficulty_buckets (dict): Ids por nivel de dificultad
+        lock (threading.Lock): Lock que protege todas las estructuras
+        not_empty (threading.Condition): Condición notificada al agregar preguntas
+    """
+
+    def __init__(self, max_bytes: int, hot_entries: int, max_uses: int = 1):
+        """
+        Inicializa un pool vacío.
+
+        Args:
+            max_bytes (int): Presupuesto de memoria del pool en bytes
+            hot_entries (int): Cantidad de preguntas que se mantienen sin comprimir
+            max_uses (int, optional): Veces que se sirve cada pregunta antes de
+                                     retirarla (1 la extrae al primer uso)
+        """
+        self.max_bytes = max_bytes
+        self.hot_entries = hot_entries
+        self.max_uses = max(1, max_uses)
+        self.nbytes = 0
+        self.records = {}
+        self.order = OrderedDict()
+        self.cold = OrderedDict()
+        self.topic_buckets = {}
+        self.difficulty_buckets = {level: OrderedDict() for level in DIFFICULTY_LEVELS}
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+
+    def put(self, question: dict) -> bool:
+        """
+        Agrega una pregunta al pool y la indexa en sus buckets.
+
+        Completa en la pregunta los campos 'id' y 'dificultad' si no los tiene.
+        Si el pool supera su presupuesto de bytes, desaloja las preguntas más
+        antiguas del bucket de dificultad más lleno.
+
+        Args:
+            question (dict): Pregunta válida a agregar
+
+        Returns:
+            bool: True si se agregó, False si la pregunta ya estaba en el pool
+                 o no entra en el presupuesto
+        """
+        question.setdefault("id", compute_question_id(question))
+        question.setdefault("dificultad", estimate_difficulty(question))
+        question_id = question["id"]
+
+        with self.not_empty:
+            if question_id in self.records:
+                return False
+
+            record = QuestionRecord(question)
+            if self._entry_bytes(record) > self.max_bytes:
+                return False
+
+            if len(self.order) - len(self.cold) >= self.hot_entries:
+                record.compress()
+                self.cold[question_id] = None
+
+            self.records[question_id] = record
+            self.order[question_id] = None
+            self.difficulty_buckets[record.dificultad][question_id] = None
+
+            for topic in self._topics_of(record):
+                self.topic_buckets.setdefault(topic, OrderedDict())[question_id] = None
+
+            self.nbytes += self._entry_bytes(record)
+            self._evict_over_budget()
+
+            if question_id not in self.records:
+                return False
+
+            self.not_empty.notify()
+            return True
+
+    def take(self, timeout: float = None, seen=None) -> dict:
+        """
+        Sirve la pregunta más antigua del pool, esperando si no hay ninguna disponible.
+
+        Args:
+            timeout (float, optional): Segundos máximos de espera. None espera
+                                     indefinidamente y 0 no espera.
+            seen (optional): Ids ya vistos que se deben saltear (soporta `in`)
+
+        Returns:
+            dict: Pregunta servida, o None si no llegó ninguna a tiempo
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self.not_empty:
+            while True:
+                question_id = self._first_unseen(self.order, seen)
+                if question_id is not None:
+                    return self._serve(question_id)
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self.not_empty.wait(remaining)
+
+    def take_from_difficulty(self, difficulty: str, seen=None) -> dict:
+        """
+        Sirve sin esperar la pregunta más antigua de un nivel de dificultad.
+
+        Args:
+            difficulty (str): Uno de los niveles de DIFFICULTY_LEVELS
+            seen (optional): Ids ya vistos que se deben saltear (soporta `in`)
+
+        Returns:
+            dict: Pregunta servida, o None si el bucket no tiene preguntas sin ver
+        """
+        with self.lock:
+            bucket = self.difficulty_buckets.get(difficulty)
+            question_id = self._first_unseen(bucket, seen)
+            return self._serve(question_id) if question_id is not None else None
+
+    def take_by_id(self, question_id: str) -> dict:
+        """
+        Extrae una pregunta concreta por su id.
+
+        Args:
+            question_id (str): Id de la pregunta
+
+        Returns:
+            dict: Pregunta extraída, o None si no está en el pool
+        """
+        with self.lock:
+            if question_id not in self.records:
+                return None
+            return self._unlink(question_id).to_dict()
+
+    def peek(self) -> dict:
+        """
+        Devuelve la pregunta más antigua sin servirla ni extraerla del pool.
+
+        Returns:
+            dict: Pregunta encontrada, o None si el pool está vacío
+        """
+        with self.lock:
+            if not self.order:
+                return None
+            return self.records[next(iter(self.order))].to_dict()
+
+    def resize(self, max_bytes: int) -> None:
+        """
+        Cambia en caliente el presupuesto de bytes del pool.
+
+        Al agrandarlo se conservan todas las preguntas; al achicarlo solo se
+        desalojan las necesarias para entrar en el nuevo presupuesto.
+
+        Args:
+            max_bytes (int): Nuevo presupuesto de memoria en bytes
+        """
+        with self.lock:
+            self.max_bytes = max_bytes
+            self._evict_over_budget()
+
+    def set_max_uses(self, max_uses: int) -> None:
+        """
+        Cambia en caliente la cantidad de usos de cada pregunta antes de retirarla.
+
+        Las preguntas que ya superaron el nuevo límite se retiran en su próximo uso.
+
+        Args:
+            max_uses (int): Veces que se sirve cada pregunta (1 la extrae al primer uso)
+        """
+        with self.lock:
+            self.max_uses = max(1, max_uses)
+
+    def qsize(self) -> int:
+        """
+        Obtiene la cantidad de preguntas en el pool.
+
+        Returns:
+            int: Cantidad de preguntas disponibles
+        """
+        with self.lock:
+            return len(self.records)
+
+    def is_full(self) -> bool:
+        """
+        Indica si el pool alcanzó su presupuesto de bytes.
+
+        Returns:
+            bool: True si no conviene agregar más preguntas
+        """
+        with self.lock:
+            return self.nbytes >= self.max_bytes
+
+    def memory_footprint(self) -> dict:
+        """
+        Obtiene el consumo de memoria del pool.
+
+        Returns:
+            dict: Diccionario con 'entradas', 'comprimidas', 'bytes' y 'max_bytes'
+        """
+        with self.lock:
+            return {
+                "entradas": len(self.records),
+                "comprimidas": len(self.cold),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes
+            }
+
+    def bucket_sizes(self) -> dict:
+        """
+        Obtiene el nivel de llenado de cada bucket.
+
+        Returns:
+            dict: Diccionario con las claves 'tematicas' y 'dificultades', cada
+                 una con la cantidad de preguntas por bucket
+        """
+        with self.lock:
+            return {
+                "tematicas": {topic: len(bucket) for topic, bucket in self.topic_buckets.items()},
+                "dificultades": {level: len(bucket) for level, bucket in self.difficulty_buckets.items()}
+            }
+
+    def overrepresented_topics(self) -> list:
+        """
+        Obtiene las temáticas con más preguntas que el promedio de los buckets.
+
+        El productor las evita al generar para rellenar los buckets que se
+        están vaciando.
+
+        Returns:
+            list: Temáticas por encima del promedio de llenado
+        """
+        with self.lock:
+            if not self.topic_buckets:
+                return []
+            average = sum(len(bucket) for bucket in self.topic_buckets.values()) / len(self.topic_buckets)
+            return [topic for topic, bucket in self.topic_buckets.items() if len(bucket) > average]
+
+    def most_depleted_difficulty(self) -> str:
+        """
+        Obtiene el nivel de dificultad con menos preguntas disponibles.
+
+        Returns:
+            str: Nivel de DIFFICULTY_LEVELS con el bucket menos lleno
+        """
+        with self.lock:
+            return min(DIFFICULTY_LEVELS, key=lambda level: len(self.difficulty_buckets[level]))
+
+    def clear(self) -> None:
+        """
+        Elimina todas las preguntas del pool.
+        """
+        with self.lock:
+            self.records.clear()
+            self.order.clear()
+            self.cold.clear()
+            self.topic_buckets.clear()
+            for bucket in self.difficulty_buckets.values():
+                bucket.clear()
+            self.nbytes = 0
+
+    def _first_unseen(self, bucket: OrderedDict, seen) -> str:
+        """
+        Busca la pregunta más antigua de un bucket que no esté entre las vistas. Requiere tener el lock.
+
+        Args:
+            bucket (OrderedDict): Ids en orden de servicio, o None
+            seen: Ids ya vistos (soporta `in`), o None para no filtrar
+
+        Returns:
+            str: Id encontrado, o None si no hay ninguno entre las primeras
+                 _SEEN_SCAN_LIMIT candidatas
+        """
+        if not bucket:
+            return None
+
+        for index, question_id in enumerate(bucket):
+            if index >= _SEEN_SCAN_LIMIT:
+                return None
+            if seen is None or question_id not in seen:
+                return question_id
+
+        return None
+
+    def _serve(self, question_id: str) -> dict:
+        """
+        Sirve una pregunta: la retira si agotó sus usos o la rota al final. Requiere tener el lock.
+
+        Al rotarla, la pregunta deja de estar próxima a servirse: se comprime
+        y se descomprime la siguiente pregunta comprimida, de modo que las
+        `hot_entries` preguntas sin comprimir sigan siendo las del frente.
+
+        Args:
+            question_id (str): Id de una pregunta presente en el pool
+
+        Returns:
+            dict: Pregunta servida
+        """
+        record = self.records[question_id]
+        record.usos += 1
+
+        if record.usos >= self.max_uses:
+            return self._unlink(question_id).to_dict()
+
+        question = record.to_dict()
+
+        self.order.move_to_end(question_id)
+        self.difficulty_buckets[record.dificultad].move_to_end(question_id)
+        for topic in self._topics_of(record):
+            self.topic_buckets[topic].move_to_end(question_id)
+
+        if question_id in self.cold:
+            self.cold.move_to_end(question_id)
+        elif len(self.order) > self.hot_entries:
+            self.nbytes += record.compress()
+            self.cold[question_id] = None
+            self._promote_hot()
+
+        return question
+
+    def _unlink(self, question_id: str) -> QuestionRecord:
+        """
+        Elimina una pregunta de todos los índices. Requiere tener el lock.
+
+        Después de eliminarla, descomprime la siguiente pregunta comprimida si
+        quedó lugar entre las `hot_entries` próximas a servirse.
+
+        Args:
+            question_id (str): Id de una pregunta presente en el pool
+
+        Returns:
+            QuestionRecord: Pregunta eliminada
+        """
+        record = self.records.pop(question_id)
+        self.nbytes -= self._entry_bytes(record)
+        del self.order[question_id]
+        self.cold.pop(question_id, None)
+        del self.difficulty_buckets[record.dificultad][question_id]
+
+        for topic in self._topics_of(record):
+            bucket = self.topic_buckets[topic]
+            del bucket[question_id]
+            if not bucket:
+                del self.topic_buckets[topic]
+
+        self._promote_hot()
+        return record
+
+    def _promote_hot(self) -> None:
+        """
+        Descomprime las primeras preguntas comprimidas hasta completar `hot_entries`. Requiere tener el lock.
+
+        `cold` conserva el mismo orden relativo que `order`, por lo que su
+        primera pregunta es la comprimida más próxima a servirse.
+        """
+        while self.cold and len(self.order) - len(self.cold) < self.hot_entries:
+            promoted_id, _ = self.cold.popitem(last=False)
+            self.nbytes += self.records[promoted_id].decompress()
+
+    def _evict_over_budget(self) -> None:
+        """
+        Desaloja preguntas hasta volver al presupuesto de bytes. Requiere tener el lock.
+
+        Cada desalojo elimina la pregunta más antigua del bucket de dificultad
+        más lleno, para no desequilibrar la mezcla de dificultades.
+        """
+        while self.nbytes > self.max_bytes and self.records:
+            fullest = max(DIFFICULTY_LEVELS, key=lambda level: len(self.difficulty_buckets[level]))
+            self._unlink(next(iter(self.difficulty_buckets[fullest])))
+
+    @staticmethod
+    def _entry_bytes(record: QuestionRecord) -> int:
+        """
+        Calcula la memoria que ocupa una pregunta en el pool, índices incluidos.
+
+        Args:
+            record (QuestionRecord): Registro de la pregunta
+
+        Returns:
+            int: Tamaño aproximado en bytes
+        """
+        return record.nbytes + _INDEX_ENTRY_BYTES * (3 + len(record.tematicas))
+
+    @staticmethod
+    def _topics_of(record: QuestionRecord) -> set:
+        """
+        Obtiene las temáticas normalizadas (sin repetir) de una pregunta.
+
+        Args:
+            record (QuestionRecord): Registro de la pregunta
+
+        Returns:
+            set: Temáticas normalizadas
+        """
+        return {normalize_topic(topic) for topic in record.tematicas}
@@ -0,0 +1,77 @@
+import threading
+from cachetools import TTLCache
+from app.config import settings
+from app.utils.question_index import compute_question_id, estimate_difficulty
+from app.utils.question_record import QuestionRecord
+
+class QuestionStore:
+    """
+    Archivo de las preguntas servidas, indexadas por id.
+
+    Conserva cada pregunta entregada a un alumno mientras pueda ser necesaria
+    para revisar sus resultados, de modo que el registro de respuestas y la
+    sesión solo guarden el id de la pregunta en lugar de la pregunta completa.
+
+    Características:
+    - Registros compactos (QuestionRecord) con la explicación comprimida
+    - Expiración tras SESSION_MAX_AGE segundos, igual que las sesiones
+    - Tamaño máximo QUESTION_STORE_SIZE; al llenarse se descartan las más antiguas
+
+    Attributes:
+        records (TTLCache): Preguntas (QuestionRecord) indexadas por id
+        lock (threading.Lock): Lock para acceso thread-safe al archivo
+    """
+
+    def __init__(self):
+        """
+        Inicializa el archivo vacío con el tamaño y la expiración de settings.
+        """
+        self.records = TTLCache(
+            maxsize=settings.QUESTION_STORE_SIZE,
+            ttl=settings.SESSION_MAX_AGE
+        )
+        self.lock = threading.Lock()
+
+    def remember(self, question: dict) -> str:
+        """
+        Archiva una pregunta servida (o renueva su expiración si ya estaba).
+
+        Args:
+            question (dict): Pregunta con estructura válida
+
+        Returns:
+            str: Id de la pregunta
+        """
+        question_id = question.get("id") or compute_question_id(question)
+
+        with self.lock:
+            record = self.records.get(question_id)
+
+            if record is None:
+                record = QuestionRecord(dict(
+                    question,
+                    id=question_id,
+                    dificultad=question.get("dificultad") or estimate_difficulty(question)
+                ))
+                record.compress()
+
+            self.records[question_id] = record
+
+        return question_id
+
+    def lookup(self, question_id: str) -> dict:
+        """
+        Busca una pregunta archivada por su id.
+
+        Args:
+            question_id (str): Id de la pregunta
+
+        Returns:
+            dict: Pregunta completa, o None si no está archivada o expiró
+        """
+        with self.lock:
+            record = self.records.get(question_id)
+
+        return record.to_dict() if record is not None else None
+
+question_store = QuestionStore()
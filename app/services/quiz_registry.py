@@ -0,0 +1,102 @@
+import threading
+import time
+import uuid
+from cachetools import TTLCache
+from itsdangerous import URLSafeSerializer, BadSignature
+from app.config import settings
+from app.services.question_store import question_store
+
+class QuizRegistry:
+    """
+    Registro de los quizzes completos entregados por la API JSON.
+
+    La API entrega todas las preguntas de un quiz en una sola respuesta y sin
+    las respuestas correctas. Este registro conserva del lado del servidor los
+    ids de las preguntas originales para poder corregir el envío final,
+    identificando cada quiz con un id firmado que el cliente no puede
+    falsificar. Las preguntas se archivan en el QuestionStore, con registros
+    compactos compartidos entre todos los quizzes que las reciben.
+
+    El id firmado solo identifica el quiz; las preguntas viven en la memoria
+    de este proceso, por lo que la aplicación debe ejecutarse con un único
+    worker para que el envío llegue al proceso que entregó el quiz.
+
+    Características:
+    - Almacenamiento en memoria con expiración (TTLCache)
+    - Ids firmados con la clave secreta de sesión
+    - Cada quiz se puede corregir una sola vez
+    - Solo los ids de las preguntas por quiz; las preguntas completas se
+      resuelven en el QuestionStore al corregir
+
+    Attributes:
+        serializer (URLSafeSerializer): Serializador para firmar los ids de quiz
+        quizzes (TTLCache): Quizzes pendientes de corrección indexados por clave interna
+        lock (threading.Lock): Lock para acceso thread-safe al registro
+    """
+
+    def __init__(self):
+        """
+        Inicializa el registro con el serializador y el almacenamiento con expiración.
+
+        Los quizzes expiran tras SESSION_MAX_AGE segundos, igual que las sesiones
+        del flujo HTML.
+        """
+        self.serializer = URLSafeSerializer(settings.SESSION_SECRET_KEY, salt="api-quiz")
+        self.quizzes = TTLCache(
+            maxsize=settings.API_MAX_ACTIVE_QUIZZES,
+            ttl=settings.SESSION_MAX_AGE
+        )
+        self.lock = threading.Lock()
+
+    def register_quiz(self, questions: list) -> str:
+        """
+        Registra un quiz recién entregado y devuelve su id firmado.
+
+        Args:
+            questions (list): Preguntas completas (con respuestas) del quiz
+
+        Returns:
+            str: Id firmado del quiz para enviar al cliente
+        """
+        quiz_key = uuid.uuid4().hex
+        question_ids = [question_store.remember(question) for question in questions]
+
+        with self.lock:
+            self.quizzes[quiz_key] = {
+                'ids': question_ids,
+                'inicio': int(time.time())
+            }
+
+        return self.serializer.dumps(quiz_key)
+
+    def pop_quiz(self, quiz_id: str) -> dict:
+        """
+        Obtiene y elimina un quiz registrado a partir de su id firmado.
+
+        Args:
+            quiz_id (str): Id firmado entregado al cliente
+
+        Returns:
+            dict: Quiz con las claves 'preguntas' (completas, resueltas en el
+                 QuestionStore) e 'inicio', o None si el id es inválido, ya fue
+                 corregido o expiró, o si alguna de sus preguntas ya no está
+                 archivada
+        """
+        try:
+            quiz_key = self.serializer.loads(quiz_id)
+        except BadSignature:
+            return None
+
+        with self.lock:
+            quiz = self.quizzes.pop(quiz_key, None)
+
+        if quiz is None:
+            return None
+
+        questions = [question_store.lookup(question_id) for question_id in quiz['ids']]
+        if any(question is None for question in questions):
+            return None
+
+        return {'preguntas': questions, 'inicio': quiz['inicio']}
+
+quiz_registry = QuizRegistry()
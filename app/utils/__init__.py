@@ -1,4 +1,25 @@
 from .session_manager import session_manager
 from .question_validator import is_question_valid, validate_question_structure
+from .quiz_grader import is_answer_correct, build_error_entry, grade_answers
+from .question_index import DIFFICULTY_LEVELS, compute_question_id, estimate_difficulty, difficulty_for_position
+from .seen_filter import SeenFilter
+from .deadline import Deadline, watch_disconnect
+from .rate_limiter import session_limiter, client_key
 
-__all__ = ["session_manager", "is_question_valid", "validate_question_structure"]
+__all__ = [
+    "session_manager",
+    "is_question_valid",
+    "validate_question_structure",
+    "is_answer_correct",
+    "build_error_entry",
+    "grade_answers",
+    "DIFFICULTY_LEVELS",
+    "compute_question_id",
+    "estimate_difficulty",
+    "difficulty_for_position",
+    "SeenFilter",
+    "Deadline",
+    "watch_disconnect",
+    "session_limiter",
+    "client_key"
+]
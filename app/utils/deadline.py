@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+from fastapi import Request
+
+class Deadline:
+    """
+    Plazo máximo de un request, compartido entre las rutas, el cache y Gemini.
+
+    Combina un vencimiento por tiempo con una cancelación explícita (por
+    ejemplo, cuando el cliente se desconecta). Se consulta desde el event
+    loop y desde los hilos del executor, por lo que la cancelación se guarda
+    en un threading.Event.
+
+    Attributes:
+        expires_at (float): Instante de vencimiento (time.monotonic)
+        cancelled_event (threading.Event): Evento que se activa al cancelar
+    """
+
+    def __init__(self, seconds: float):
+        """
+        Crea un plazo que vence dentro de `seconds` segundos.
+
+        Args:
+            seconds (float): Duración del plazo en segundos
+        """
+        self.expires_at = time.monotonic() + seconds
+        self.cancelled_event = threading.Event()
+
+    def remaining(self) -> float:
+        """
+        Obtiene el tiempo restante del plazo.
+
+        Returns:
+            float: Segundos restantes (0 si venció o fue cancelado)
+        """
+        if self.cancelled_event.is_set():
+            return 0.0
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def cap(self, timeout: float) -> float:
+        """
+        Limita un timeout al tiempo restante del plazo.
+
+        Args:
+            timeout (float): Timeout deseado en segundos
+
+        Returns:
+            float: El menor entre `timeout` y el tiempo restante
+        """
+        return min(timeout, self.remaining())
+
+    @property
+    def done(self) -> bool:
+        """
+        Indica si ya no tiene sentido seguir trabajando para este plazo.
+
+        Returns:
+            bool: True si el plazo venció o fue cancelado
+        """
+        return self.remaining() <= 0
+
+    def cancel(self) -> None:
+        """
+        Cancela el plazo; todo el trabajo asociado debe abandonarse.
+        """
+        self.cancelled_event.set()
+
+async def watch_disconnect(request: Request, deadline: Deadline, interval: float) -> None:
+    """
+    Cancela el plazo en cuanto el cliente se desconecta.
+
+    Pensada para ejecutarse como tarea mientras el request espera preguntas;
+    termina sola cuando el plazo vence o es cancelado.
+
+    Args:
+        request (Request): Request del cliente
+        deadline (Deadline): Plazo a cancelar
+        interval (float): Segundos entre cada verificación de la conexión
+    """
+    while not deadline.done:
+        if await request.is_disconnected():
+            deadline.cancel()
+            return
+        await asyncio.sleep(interval)
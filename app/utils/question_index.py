@@ -0,0 +1,97 @@
+import ast
+import hashlib
+
+DIFFICULTY_LEVELS = ("basica", "intermedia", "avanzada")
+
+_OPERATION_NODES = (
+    ast.BinOp,
+    ast.AugAssign,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.Call,
+    ast.Subscript,
+    ast.JoinedStr,
+    ast.IfExp
+)
+
+def compute_question_id(question: dict) -> str:
+    """
+    Calcula un id estable para una pregunta a partir de su contenido.
+
+    Dos preguntas con el mismo enunciado, código y opciones obtienen el mismo
+    id, lo que permite además detectar duplicados en el cache.
+
+    Args:
+        question (dict): Pregunta con estructura válida
+
+    Returns:
+        str: Id hexadecimal de 16 caracteres
+    """
+    content = "\x1f".join([
+        question.get("pregunta") or "",
+        question.get("codigo") or "",
+        "\x1e".join(question.get("respuestas") or [])
+    ])
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+def normalize_topic(topic: str) -> str:
+    """
+    Normaliza el nombre de una temática para usarlo como clave de índice.
+
+    Args:
+        topic (str): Temática tal como la devuelve Gemini
+
+    Returns:
+        str: Temática en minúsculas y sin espacios en los extremos
+    """
+    return str(topic).strip().lower()
+
+def estimate_difficulty(question: dict) -> str:
+    """
+    Estima la dificultad de una pregunta a partir de su código.
+
+    El puntaje combina la cantidad de líneas ejecutables con la cantidad de
+    operaciones utilizadas (aritméticas, llamadas, f-strings, índices, etc.).
+    Si el código no se puede analizar, se usan solo las líneas.
+
+    Args:
+        question (dict): Pregunta con estructura válida
+
+    Returns:
+        str: Uno de los niveles de DIFFICULTY_LEVELS
+    """
+    code = question.get("codigo") or ""
+    lines = [
+        line for line in code.splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+    try:
+        tree = ast.parse(code)
+        operations = sum(isinstance(node, _OPERATION_NODES) for node in ast.walk(tree))
+    except (SyntaxError, ValueError):
+        operations = len(lines)
+
+    score = len(lines) + operations
+
+    if score <= 8:
+        return "basica"
+    if score <= 16:
+        return "intermedia"
+    return "avanzada"
+
+def difficulty_for_position(position: int) -> str:
+    """
+    Devuelve la dificultad objetivo para una posición del quiz.
+
+    Alterna cíclicamente los niveles para que cada sesión reciba una mezcla
+    equilibrada de dificultades.
+
+    Args:
+        position (int): Cantidad de preguntas ya respondidas en la sesión
+
+    Returns:
+        str: Uno de los niveles de DIFFICULTY_LEVELS
+    """
+    return DIFFICULTY_LEVELS[position % len(DIFFICULTY_LEVELS)]
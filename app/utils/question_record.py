@@ -0,0 +1,178 @@
+import sys
+import zlib
+
+class QuestionRecord:
+    """
+    Representación compacta de una pregunta almacenada en el cache.
+
+    Reemplaza al diccionario de la pregunta mientras está en el pool:
+    - Usa __slots__, sin diccionario de atributos por instancia
+    - Guarda opciones y temáticas como tuplas
+    - Interna las cadenas repetidas entre preguntas (temáticas, dificultad,
+      categoría) para que todas las preguntas compartan la misma copia
+    - Puede guardar la explicación (el campo más largo) comprimida con zlib
+
+    El tamaño en bytes se calcula al crear el registro y al comprimir o
+    descomprimir la explicación, para que el pool pueda llevar la cuenta
+    de su consumo de memoria sin recorrer las preguntas.
+
+    Attributes:
+        id (str): Id de la pregunta
+        pregunta (str): Enunciado
+        codigo (str): Código Python a analizar
+        respuestas (tuple): Opciones
+        respuesta_correcta (str): Respuesta correcta
+        tematicas (tuple): Temáticas usadas (cadenas internadas)
+        dificultad (str): Nivel de dificultad (cadena internada)
+        categoria (str): Categoría de la pregunta (cadena internada)
+        usos (int): Veces que la pregunta ya fue servida
+        nbytes (int): Tamaño aproximado del registro en memoria
+    """
+
+    __slots__ = (
+        "id",
+        "pregunta",
+        "codigo",
+        "respuestas",
+        "respuesta_correcta",
+        "tematicas",
+        "dificultad",
+        "categoria",
+        "usos",
+        "nbytes",
+        "_explicacion"
+    )
+
+    def __init__(self, question: dict):
+        """
+        Crea el registro a partir de una pregunta con estructura válida.
+
+        Args:
+            question (dict): Pregunta con 'id' y 'dificultad' ya asignados
+        """
+        topics = question.get("tematicas_usadas") or []
+        if isinstance(topics, str):
+            topics = [topics]
+
+        self.id = question["id"]
+        self.pregunta = question["pregunta"]
+        self.codigo = question["codigo"]
+        self.respuestas = tuple(question["respuestas"])
+        self.respuesta_correcta = question["respuesta_correcta"]
+        self.tematicas = tuple(sys.intern(str(topic)) for topic in topics)
+        self.dificultad = sys.intern(question["dificultad"])
+        self.categoria = sys.intern(question["categoria"]) if question.get("categoria") else None
+        self._explicacion = question.get("explicacion") or ""
+        self.usos = 0
+        self.nbytes = self._measure()
+
+    @property
+    def explicacion(self) -> str:
+        """
+        Devuelve la explicación, descomprimiéndola si es necesario.
+
+        Returns:
+            str: Explicación de la pregunta
+        """
+        if isinstance(self._explicacion, bytes):
+            return zlib.decompress(self._explicacion).decode("utf-8")
+        return self._explicacion
+
+    @property
+    def is_compressed(self) -> bool:
+        """
+        Indica si la explicación está almacenada comprimida.
+
+        Returns:
+            bool: True si la explicación está comprimida
+        """
+        return isinstance(self._explicacion, bytes)
+
+    def compress(self) -> int:
+        """
+        Comprime la explicación si todavía no lo está.
+
+        Solo se conserva la versión comprimida si realmente ocupa menos.
+
+        Returns:
+            int: Variación del tamaño del registro en bytes (negativa si se redujo)
+        """
+        if self.is_compressed or not self._explicacion:
+            return 0
+
+        compressed = zlib.compress(self._explicacion.encode("utf-8"))
+        if sys.getsizeof(compressed) >= sys.getsizeof(self._explicacion):
+            return 0
+
+        return self._replace_explanation(compressed)
+
+    def decompress(self) -> int:
+        """
+        Descomprime la explicación si está comprimida.
+
+        Returns:
+            int: Variación del tamaño del registro en bytes (positiva si creció)
+        """
+        if not self.is_compressed:
+            return 0
+
+        return self._replace_explanation(self.explicacion)
+
+    def to_dict(self) -> dict:
+        """
+        Reconstruye el diccionario de la pregunta que usa el resto de la aplicación.
+
+        Returns:
+            dict: Pregunta con la misma estructura que validate_question_structure,
+                 más los campos 'id', 'dificultad' y 'categoria'
+        """
+        question = {
+            "id": self.id,
+            "pregunta": self.pregunta,
+            "codigo": self.codigo,
+            "respuestas": list(self.respuestas),
+            "respuesta_correcta": self.respuesta_correcta,
+            "explicacion": self.explicacion,
+            "tematicas_usadas": list(self.tematicas),
+            "dificultad": self.dificultad
+        }
+
+        if self.categoria is not None:
+            question["categoria"] = self.categoria
+
+        return question
+
+    def _replace_explanation(self, explanation) -> int:
+        """
+        Reemplaza la explicación almacenada y actualiza el tamaño del registro.
+
+        Args:
+            explanation (str | bytes): Nueva explicación, en texto o comprimida
+
+        Returns:
+            int: Variación del tamaño del registro en bytes
+        """
+        previous = self.nbytes
+        self._explicacion = explanation
+        self.nbytes = self._measure()
+        return self.nbytes - previous
+
+    def _measure(self) -> int:
+        """
+        Calcula el tamaño aproximado del registro en memoria.
+
+        Las cadenas internadas (temáticas, dificultad, categoría) no se cuentan
+        porque se comparten entre todas las preguntas.
+
+        Returns:
+            int: Tamaño en bytes
+        """
+        size = sys.getsizeof(self)
+        size += sys.getsizeof(self.id)
+        size += sys.getsizeof(self.pregunta)
+        size += sys.getsizeof(self.codigo)
+        size += sys.getsizeof(self.respuesta_correcta)
+        size += sys.getsizeof(self._explicacion)
+        size += sys.getsizeof(self.respuestas) + sum(sys.getsizeof(option) for option in self.respuestas)
+        size += sys.getsizeof(self.tematicas)
+        return size
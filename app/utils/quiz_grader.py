@@ -0,0 +1,70 @@
+def is_answer_correct(selection: str, correct_answer: str) -> bool:
+    """
+    Compara la respuesta del usuario con la respuesta correcta.
+
+    Args:
+        selection (str): Opción seleccionada por el usuario
+        correct_answer (str): Respuesta correcta de la pregunta
+
+    Returns:
+        bool: True si la selección coincide con la respuesta correcta
+              (ignorando espacios en los extremos), False en caso contrario
+    """
+    if not selection or not correct_answer:
+        return False
+
+    return selection.strip() == correct_answer.strip()
+
+def build_error_entry(question: dict, selection: str) -> dict:
+    """
+    Construye el registro de una pregunta respondida incorrectamente.
+
+    La estructura coincide con la que espera la plantilla resultado.html
+    para mostrar los errores con su explicación.
+
+    Args:
+        question (dict): Pregunta respondida
+        selection (str): Opción seleccionada por el usuario
+
+    Returns:
+        dict: Registro del error con la pregunta, el código, ambas respuestas
+              y la explicación
+    """
+    return {
+        "pregunta": question.get("pregunta"),
+        "codigo": question.get("codigo"),
+        "respuesta_correcta": question.get("respuesta_correcta"),
+        "respuesta_usuario": selection,
+        "explicacion": question.get("explicacion", "")
+    }
+
+def grade_answers(questions: list, selections: list) -> dict:
+    """
+    Corrige un conjunto completo de respuestas.
+
+    Las selecciones se emparejan por posición con las preguntas. Las preguntas
+    sin selección correspondiente se cuentan como incorrectas.
+
+    Args:
+        questions (list): Preguntas del quiz en el orden en que se entregaron
+        selections (list): Opciones seleccionadas por el usuario, en el mismo orden
+
+    Returns:
+        dict: Resultado con las claves 'correctas', 'total' y 'errores'
+    """
+    correct = 0
+    errors = []
+
+    for index, question in enumerate(questions):
+        selection = selections[index] if index < len(selections) else ""
+
+        if is_answer_correct(selection, question["respuesta_correcta"]):
+            correct += 1
+        else:
+            errors.append(build_error_entry(question, selection))
+
+    return {
+        "correctas": correct,
+        "total": len(questions),
+        "errores": errors
+    }
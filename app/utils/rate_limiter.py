@@ -0,0 +1,81 @@
+import threading
+import time
+from cachetools import TTLCache
+from starlette.requests import HTTPConnection
+from app.config import settings
+
+class TokenBucketLimiter:
+    """
+    Limitador de frecuencia por cliente basado en token buckets.
+
+    Cada cliente dispone de hasta `capacity` fichas que se recargan a razón
+    de `refill_rate` fichas por segundo; cada operación limitada consume una.
+    Los buckets se guardan en un TTLCache: un bucket sin uso durante el
+    tiempo que tarda en recargarse por completo se descarta, ya que
+    recrearlo lleno es equivalente.
+
+    Attributes:
+        capacity (float): Máximo de fichas por cliente
+        refill_rate (float): Fichas recargadas por segundo
+        buckets (TTLCache): Par (fichas, instante de actualización) por cliente
+        lock (threading.Lock): Lock para acceso thread-safe a los buckets
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, max_clients: int):
+        """
+        Inicializa el limitador sin buckets.
+
+        Args:
+            capacity (float): Máximo de fichas por cliente
+            refill_rate (float): Fichas recargadas por segundo
+            max_clients (int): Máximo de clientes con bucket en memoria
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.buckets = TTLCache(maxsize=max_clients, ttl=capacity / refill_rate)
+        self.lock = threading.Lock()
+
+    def allow(self, client: str) -> bool:
+        """
+        Consume una ficha del bucket del cliente, si tiene alguna disponible.
+
+        Args:
+            client (str): Identificador del cliente
+
+        Returns:
+            bool: True si la operación está permitida
+        """
+        now = time.monotonic()
+
+        with self.lock:
+            tokens, updated_at = self.buckets.get(client, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_rate)
+            allowed = tokens >= 1
+
+            self.buckets[client] = (tokens - 1 if allowed else tokens, now)
+            return allowed
+
+def client_key(connection: HTTPConnection) -> str:
+    """
+    Obtiene el identificador de cliente usado para limitar la frecuencia.
+
+    Detrás de un proxy inverso, connection.client es la dirección del proxy y
+    todos los clientes compartirían un mismo bucket. En ese caso uvicorn debe
+    ejecutarse con --proxy-headers y --forwarded-allow-ips (la IP del proxy),
+    para que la dirección del cliente se tome de X-Forwarded-For. Las
+    cabeceras no se leen aquí: sin esa lista de proxies confiables cualquier
+    cliente podría falsificarlas y obtener buckets nuevos a voluntad.
+
+    Args:
+        connection (HTTPConnection): Request HTTP o conexión WebSocket
+
+    Returns:
+        str: Dirección IP del cliente, o 'desconocido' si no está disponible
+    """
+    return connection.client.host if connection.client else "desconocido"
+
+session_limiter = TokenBucketLimiter(
+    capacity=settings.SESSION_BUCKET_CAPACITY,
+    refill_rate=settings.SESSION_BUCKET_REFILL,
+    max_clients=settings.RATE_LIMIT_CLIENTS
+)
@@ -0,0 +1,108 @@
+import base64
+import hashlib
+from app.config import settings
+from app.utils.question_index import compute_question_id
+
+class SeenFilter:
+    """
+    Filtro de Bloom con los ids de las preguntas que ya vio una sesión.
+
+    Ocupa un tamaño fijo (SEEN_FILTER_BITS bits) sin importar cuántas
+    preguntas se agreguen, por lo que puede viajar en la cookie de sesión.
+    Nunca da falsos negativos: una pregunta agregada siempre se reconoce
+    como vista. Puede dar falsos positivos con baja probabilidad, lo que
+    solo hace que se salte una pregunta que en realidad no se vio.
+
+    Attributes:
+        size (int): Cantidad de bits del filtro
+        hashes (int): Cantidad de posiciones marcadas por id
+        bits (int): Bits del filtro
+    """
+
+    def __init__(self, bits: int = 0):
+        """
+        Inicializa el filtro.
+
+        Args:
+            bits (int, optional): Bits iniciales del filtro (vacío por defecto)
+        """
+        self.size = settings.SEEN_FILTER_BITS
+        self.hashes = settings.SEEN_FILTER_HASHES
+        self.bits = bits
+
+    @classmethod
+    def from_token(cls, token: str) -> "SeenFilter":
+        """
+        Reconstruye un filtro a partir de su representación en la sesión.
+
+        Args:
+            token (str): Token generado por to_token, o None
+
+        Returns:
+            SeenFilter: Filtro reconstruido, o vacío si el token falta o es inválido
+        """
+        if not token:
+            return cls()
+
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        except (ValueError, TypeError):
+            return cls()
+
+        return cls(int.from_bytes(raw, "big"))
+
+    def to_token(self) -> str:
+        """
+        Serializa el filtro en un texto compacto para la cookie de sesión.
+
+        Returns:
+            str: Bits del filtro en base64 url-safe, sin relleno
+        """
+        raw = self.bits.to_bytes((self.size + 7) // 8, "big")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def add(self, question_id: str) -> None:
+        """
+        Marca un id de pregunta como visto.
+
+        Args:
+            question_id (str): Id de la pregunta
+        """
+        for position in self._positions(question_id):
+            self.bits |= 1 << position
+
+    def add_question(self, question: dict) -> None:
+        """
+        Marca una pregunta como vista, calculando su id si no lo tiene.
+
+        Args:
+            question (dict): Pregunta servida
+        """
+        self.add(question.get("id") or compute_question_id(question))
+
+    def __contains__(self, question_id: str) -> bool:
+        """
+        Indica si un id de pregunta (probablemente) ya fue visto.
+
+        Args:
+            question_id (str): Id de la pregunta
+
+        Returns:
+            bool: True si todas sus posiciones están marcadas
+        """
+        return all(self.bits >> position & 1 for position in self._positions(question_id))
+
+    def _positions(self, question_id: str) -> list:
+        """
+        Calcula las posiciones del filtro correspondientes a un id (doble hashing).
+
+        Args:
+            question_id (str): Id de la pregunta
+
+        Returns:
+            list: Posiciones de bits entre 0 y size - 1
+        """
+        digest = hashlib.blake2b(question_id.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
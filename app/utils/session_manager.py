@@ -1,7 +1,10 @@
 from fastapi import Request, Response
 from itsdangerous import URLSafeSerializer, BadSignature
 from app.config import settings
+from app.prompts import DEFAULT_CATEGORY
+from app.utils.seen_filter import SeenFilter
 import time
+import uuid
 
 class SessionManager:
     """
@@ -12,11 +15,13 @@ class SessionManager:
     de forma segura entre requests.
     
     La sesión almacena:
+    - Id de la sesión (clave del registro de respuestas)
     - Puntaje actual del usuario
+    - Categoría del quiz
     - Total de preguntas respondidas
     - Tiempo de inicio del quiz
     - Pregunta actual
-    - Lista de errores cometidos
+    - Filtro compacto de las preguntas ya vistas (SeenFilter)
     """
     
     def __init__(self):
@@ -73,22 +78,28 @@ class SessionManager:
         """
         response.delete_cookie(settings.SESSION_COOKIE)
     
-    def create_new_session(self, initial_question: dict) -> dict:
+    def create_new_session(self, initial_question: dict, category: str = DEFAULT_CATEGORY) -> dict:
         """
         Crea una nueva sesión de quiz con valores iniciales.
         
         Args:
             initial_question (dict): Primera pregunta del quiz
+            category (str, optional): Categoría del quiz
             
         Returns:
             dict: Nueva sesión inicializada con valores por defecto
         """
+        seen = SeenFilter()
+        seen.add_question(initial_question)
+
         return {
+            'id': uuid.uuid4().hex,
             'puntaje': 0,
             'total': 0,
+            'categoria': category,
             'inicio': int(time.time()),
             'pregunta_actual': initial_question,
-            'errores': []
+            'vistas': seen.to_token()
         }
     
     def is_session_valid(self, session: dict) -> bool:
@@ -1,5 +1,5 @@
 from fastapi import FastAPI
-from app.routes import router
+from app.routes import router, api_router, ws_router, admin_router
 from app.config import settings
 
 """
@@ -14,6 +14,9 @@ Características principales:
 - Sistema de sesiones para seguimiento de progreso
 - Cache de preguntas para mejor rendimiento
 - Validación rigurosa de preguntas generadas
+- API JSON para clientes SPA y móviles (quiz completo en una sola respuesta)
+- Canal WebSocket para responder el quiz en una sola conexión
+- API de administración para ajustar el cache y la generación en caliente
 
 Autor: Sistema de Quiz Python
 Versión: 1.0.2
@@ -26,6 +29,9 @@ app = FastAPI(
 )
 
 app.include_router(router)
+app.include_router(api_router)
+app.include_router(ws_router)
+app.include_router(admin_router)
 
 if __name__ == "__main__":
     import uvicorn